@@ -0,0 +1,491 @@
+import os
+import re
+import csv
+import glob
+import time
+import threading
+import argparse
+import multiprocessing
+import pandas as pd
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from openpyxl import load_workbook
+
+from main import scrape_reviews, scrape_reviews_tabs
+
+try:
+    import psutil
+except ImportError:  # Akuntansi CPU/RSS per worker jadi kosong
+    psutil = None
+
+CATALOG_FILE = "daftar_wisata_jawa_timur.xlsx"
+PLACES_SHEET = "Wisata "
+REGIONS_SHEET = "Daerah"
+BASE_DIR = "Data_Destinasi"
+REPORT_FILE = "batch_report.csv"
+PROFILE_ROOT = "profiles"
+
+# Slot worker (0..N-1) untuk profil Chrome yang tetap per worker
+WORKER_SLOT = 0
+
+
+def _cell_text(cell):
+    v = cell.value
+    return str(v).strip() if v is not None else ""
+
+
+def _cell_url(cell):
+    """URL dari hyperlink sel (teks sel sering cuma 'link'), atau teks bila berupa URL."""
+    if cell.hyperlink and cell.hyperlink.target:
+        return cell.hyperlink.target.strip()
+    text = _cell_text(cell)
+    return text if text.startswith("http") else ""
+
+
+def _header_index(rows, required):
+    """Cari baris header (judul sheet ada di baris atas) dan posisi kolomnya."""
+    for row_idx, row in enumerate(rows):
+        names = [_cell_text(c) for c in row]
+        if all(r in names for r in required):
+            return row_idx, {name: i for i, name in enumerate(names) if name}
+    raise RuntimeError(f"Header {required} tidak ditemukan di katalog")
+
+
+def load_regions(wb):
+    """Nomor folder per (Tipe, Daerah), karena nama Daerah bisa kembar (Kabupaten/Kota Blitar)."""
+    rows = list(wb[REGIONS_SHEET].iter_rows())
+    start, cols = _header_index(rows, ["Tipe", "Daerah"])
+    regions = {}
+    for row in rows[start + 1:]:
+        tipe = _cell_text(row[cols["Tipe"]])
+        daerah = _cell_text(row[cols["Daerah"]])
+        number = _cell_text(row[cols["Daerah"] + 1]) if len(row) > cols["Daerah"] + 1 else ""
+        if tipe and daerah and number.isdigit():
+            regions[(tipe, daerah)] = int(number)
+    return regions
+
+
+def load_catalog(path=CATALOG_FILE):
+    """Baca daftar tempat wisata (Tipe, Daerah, Tempat Wisata, Kategori, LINK) dari katalog."""
+    wb = load_workbook(path)
+    regions = load_regions(wb)
+
+    rows = list(wb[PLACES_SHEET].iter_rows())
+    start, cols = _header_index(rows, ["Tipe", "Daerah", "Tempat Wisata", "Kategori", "LINK"])
+
+    places = []
+    for row in rows[start + 1:]:
+        tempat = _cell_text(row[cols["Tempat Wisata"]])
+        if not tempat:
+            continue
+        tipe = _cell_text(row[cols["Tipe"]])
+        daerah = _cell_text(row[cols["Daerah"]])
+        places.append({
+            "tipe": tipe,
+            "daerah": daerah,
+            "tempat": tempat,
+            "kategori": _cell_text(row[cols["Kategori"]]),
+            "url": _cell_url(row[cols["LINK"]]),
+            "region_no": regions.get((tipe, daerah)),
+        })
+    return places
+
+
+def _name_key(name):
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def region_dir(base_dir, place):
+    """Folder `<n>. <Daerah>`; pakai folder yang sudah ada bila nomornya cocok."""
+    existing = glob.glob(os.path.join(base_dir, f"{place['region_no']}. *"))
+    if existing:
+        return existing[0]
+    return os.path.join(base_dir, f"{place['region_no']}. {place['daerah']}")
+
+
+def place_output_path(base_dir, place):
+    """Path CSV tempat wisata; pakai file lama bila namanya sama (abaikan spasi/_/huruf besar)."""
+    folder = region_dir(base_dir, place)
+    key = _name_key(place["tempat"])
+    for path in glob.glob(os.path.join(folder, "*.csv")):
+        if _name_key(os.path.splitext(os.path.basename(path))[0]) == key:
+            return path
+    filename = re.sub(r"[^\w\-]+", "_", place["tempat"]).strip("_") + ".csv"
+    return os.path.join(folder, filename)
+
+
+class ResourceMonitor:
+    """Catat CPU dan puncak RSS proses ini beserta anak-anaknya (chromedriver + Chrome)."""
+
+    def __init__(self, interval=2.0):
+        self.interval = interval
+        self.peak_rss = 0
+        self.cpu_seconds = 0.0
+        self._seen_cpu = {}
+        self._baseline_cpu = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        root = psutil.Process()
+        rss = 0
+        for proc in [root] + root.children(recursive=True):
+            try:
+                rss += proc.memory_info().rss
+                t = proc.cpu_times()
+                self._seen_cpu[proc.pid] = t.user + t.system
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        if psutil:
+            # CPU proses worker bersifat kumulatif antar tempat, jadi kurangi baseline
+            t = psutil.Process().cpu_times()
+            self._baseline_cpu = t.user + t.system
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._sample()
+            # Proses yang sudah selesai tetap terhitung dari sampel terakhirnya
+            self.cpu_seconds = sum(self._seen_cpu.values()) - self._baseline_cpu
+
+
+def prepare_place(place, base_dir=BASE_DIR, overwrite=False, resume=False, refresh=False):
+    """Cek link/daerah/file lama; kembalikan (baris laporan, bisa resume).
+
+    Status baris masih kosong bila tempat ini perlu di-scrape.
+    """
+    output = place_output_path(base_dir, place) if place["region_no"] else ""
+    row = {**place, "output": output, "status": "", "reviews": 0, "seconds": 0.0,
+           "worker": WORKER_SLOT, "cpu_seconds": None, "peak_rss_mb": None, "page_kb": None,
+           "blocked_requests": None}
+
+    if not place["url"]:
+        row["status"] = "tanpa link"
+        print(f"  {place['tempat']}: link Maps kosong, dilewati")
+        return row, False
+    if not output:
+        row["status"] = "daerah tidak dikenal"
+        print(f"  {place['tempat']}: daerah '{place['daerah']}' tidak ada di sheet {REGIONS_SHEET}, dilewati")
+        return row, False
+
+    checkpoint_file = f"{output}.checkpoint.json"
+    can_resume = resume and os.path.exists(checkpoint_file)
+    if os.path.exists(output) and not overwrite and not can_resume and not refresh:
+        row["status"] = "sudah ada"
+        print(f"  Sudah ada: {output}")
+        return row, False
+
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    return row, can_resume
+
+
+def scrape_place(place, base_dir=BASE_DIR, overwrite=False, resume=False, profile_root=None,
+                 refresh=False, **scrape_kwargs):
+    """Scrape 1 tempat ke CSV daerahnya, kembalikan baris laporan.
+
+    Dengan `refresh`, CSV yang sudah ada hanya ditambah ulasan terbaru.
+    """
+    print("\n" + "="*60)
+    print(f"[worker {WORKER_SLOT}] {place['daerah']} - {place['tempat']}")
+    print("="*60)
+
+    row, can_resume = prepare_place(place, base_dir, overwrite, resume, refresh)
+    if row["status"]:
+        return row
+    output = row["output"]
+    checkpoint_file = f"{output}.checkpoint.json"
+    user_data_dir = os.path.join(profile_root, f"worker-{WORKER_SLOT}") if profile_root else None
+
+    incremental = refresh and not overwrite and not can_resume and os.path.exists(output)
+
+    t0 = time.time()
+    with ResourceMonitor() as monitor:
+        try:
+            reviews = scrape_reviews(
+                url=place["url"],
+                chromedriver_path=None,
+                stream_file=output,
+                checkpoint_file=checkpoint_file,
+                resume=can_resume,
+                user_data_dir=user_data_dir,
+                incremental=incremental,
+                **scrape_kwargs,
+            )
+            row["reviews"] = len(reviews)
+            if reviews.page_bytes is not None:
+                row["page_kb"] = round(reviews.page_bytes / 1024, 1)
+                row["blocked_requests"] = reviews.blocked_requests
+            if len(reviews):
+                row["status"] = "ok"
+            else:
+                row["status"] = "tidak ada baru" if incremental else "kosong"
+        except Exception as e:
+            row["status"] = f"error: {e}"
+            print(f"\n Error: {e}")
+    row["seconds"] = round(time.time() - t0, 1)
+
+    if psutil:
+        row["cpu_seconds"] = round(monitor.cpu_seconds, 1)
+        row["peak_rss_mb"] = round(monitor.peak_rss / 1024 / 1024, 1)
+    return row
+
+
+def scrape_place_group(places, base_dir=BASE_DIR, overwrite=False, resume=False, profile_root=None,
+                       tabs=3, **scrape_kwargs):
+    """Scrape beberapa tempat dalam 1 Chrome, `tabs` tempat sekaligus (1 tab per tempat).
+
+    Mode tab tidak memakai checkpoint: --resume hanya berlaku untuk mode
+    1 tempat per Chrome, tempat yang setengah jadi di-scrape ulang.
+    """
+    print("\n" + "="*60)
+    print(f"[worker {WORKER_SLOT}] {len(places)} tempat, {tabs} tab")
+    print("="*60)
+
+    rows = []
+    todo = []
+    for place in places:
+        row, _ = prepare_place(place, base_dir, overwrite, resume)
+        rows.append(row)
+        if not row["status"]:
+            todo.append(row)
+    if not todo:
+        return rows
+
+    user_data_dir = os.path.join(profile_root, f"worker-{WORKER_SLOT}") if profile_root else None
+    with ResourceMonitor() as monitor:
+        finished = scrape_reviews_tabs(
+            [(row["url"], row["output"]) for row in todo],
+            tabs=tabs,
+            user_data_dir=user_data_dir,
+            **scrape_kwargs,
+        )
+
+    by_output = {tab.output_file: tab for tab in finished}
+    for row in todo:
+        tab = by_output.get(row["output"])
+        if not tab:
+            row["status"] = "tidak dijalankan"
+            continue
+        row["reviews"] = len(tab.data)
+        row["seconds"] = round(tab.elapsed, 1)
+        if tab.data.page_bytes is not None:
+            row["page_kb"] = round(tab.data.page_bytes / 1024, 1)
+            row["blocked_requests"] = tab.data.blocked_requests
+        if tab.done_reason in ("error", "dihentikan"):
+            row["status"] = tab.done_reason
+        else:
+            row["status"] = "ok" if len(tab.data) else "kosong"
+            checkpoint_file = f"{row['output']}.checkpoint.json"
+            if os.path.exists(checkpoint_file):
+                os.remove(checkpoint_file)  # Sudah di-scrape ulang penuh
+
+    if psutil:
+        # Satu Chrome untuk semua tab: pemakaian dibagi rata per tempat
+        for row in todo:
+            row["cpu_seconds"] = round(monitor.cpu_seconds / len(todo), 1)
+            row["peak_rss_mb"] = round(monitor.peak_rss / 1024 / 1024, 1)
+    return rows
+
+
+def _init_worker(slots):
+    global WORKER_SLOT
+    WORKER_SLOT = slots.get()
+
+
+def append_report_row(report_file, row):
+    """Tambah 1 baris laporan begitu tempatnya selesai, supaya laporan selamat bila batch terhenti."""
+    fieldnames = None
+    if os.path.exists(report_file) and os.path.getsize(report_file):
+        with open(report_file, encoding="utf-8-sig", newline="") as f:
+            fieldnames = next(csv.reader(f), None)
+    if fieldnames and not set(row) <= set(fieldnames):
+        # Kolom baru: tulis ulang dengan header gabungan (laporan kecil)
+        df = pd.read_csv(report_file, encoding="utf-8-sig")
+        pd.concat([df, pd.DataFrame([row])], ignore_index=True).to_csv(report_file, index=False, encoding="utf-8-sig")
+        return
+    with open(report_file, "a", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames or list(row))
+        if not fieldnames:
+            writer.writeheader()
+        writer.writerow(row)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def run_batch(places, base_dir=BASE_DIR, overwrite=False, resume=False, report_file=REPORT_FILE,
+              workers=1, profile_root=PROFILE_ROOT, tabs=1, baseline_report=None, refresh=False,
+              **scrape_kwargs):
+    """Scrape semua tempat (berurutan atau paralel per proses), lalu gabungkan laporannya.
+
+    Dengan workers > 1, tiap worker adalah proses sendiri dengan Chrome dan
+    profil (`profile_root/worker-<n>`) sendiri; tiap tempat tetap ditulis ke
+    file CSV-nya masing-masing. Dengan tabs > 1, satu Chrome membuka
+    beberapa tempat sekaligus di tab terpisah (lihat scrape_place_group).
+    `refresh` menambah ulasan terbaru ke CSV yang sudah ada.
+    Tiap tempat mencatat page_kb (byte diterima) dan blocked_requests dari
+    performance log. `baseline_report` (laporan run lain, mis. tanpa blokir
+    resource) opsional, untuk page_kb_saved per tempat.
+
+    Tiap baris langsung ditambahkan ke `report_file` begitu tempatnya
+    selesai; ringkasan dibangun dari file itu, juga saat batch terhenti.
+    """
+    started = time.time()
+    if os.path.exists(report_file):
+        os.remove(report_file)  # Laporan run ini saja
+
+    def add(row):
+        append_report_row(report_file, row)
+
+    options = dict(base_dir=base_dir, overwrite=overwrite, resume=resume, **scrape_kwargs)
+    if refresh:
+        if tabs > 1:
+            print("  --refresh memakai 1 tempat per Chrome, --tabs diabaikan")
+            tabs = 1
+        options["refresh"] = True
+
+    try:
+        if tabs > 1:
+            # Tiap worker (atau satu-satunya Chrome) memegang satu kelompok tempat
+            groups = [places[i::workers] for i in range(max(workers, 1))]
+            groups = [g for g in groups if g]
+            if workers > 1:
+                slots = multiprocessing.Manager().Queue()
+                for slot in range(workers):
+                    slots.put(slot)
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(slots,)) as pool:
+                    futures = {pool.submit(scrape_place_group, group, profile_root=profile_root, tabs=tabs, **options): group
+                               for group in groups}
+                    for future in as_completed(futures):
+                        try:
+                            for row in future.result():
+                                add(row)
+                        except Exception as e:  # Worker mati (mis. Chrome crash membawa proses)
+                            for place in futures[future]:
+                                add({**place, "output": "", "status": f"error: {e}", "reviews": 0, "seconds": 0.0})
+            else:
+                for row in scrape_place_group(places, profile_root=profile_root, tabs=tabs, **options):
+                    add(row)
+        elif workers > 1:
+            # Profil Chrome tidak boleh dipakai 2 proses sekaligus
+            slots = multiprocessing.Manager().Queue()
+            for slot in range(workers):
+                slots.put(slot)
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(slots,)) as pool:
+                futures = {pool.submit(scrape_place, place, profile_root=profile_root, **options): place
+                           for place in places}
+                for i, future in enumerate(as_completed(futures), 1):
+                    place = futures[future]
+                    try:
+                        row = future.result()
+                    except Exception as e:  # Worker mati (mis. Chrome crash membawa proses)
+                        row = {**place, "output": "", "status": f"error: {e}", "reviews": 0, "seconds": 0.0}
+                    add(row)
+                    print(f"\n [{i}/{len(places)}] {place['tempat']}: {row['status']} ({row['reviews']} ulasan)")
+        else:
+            for place in places:
+                add(scrape_place(place, profile_root=profile_root, **options))
+    finally:
+        # Juga saat Ctrl+C/SIGTERM: ringkasan dari baris yang sudah tertulis
+        df = summarize_report(report_file, started, workers, tabs, baseline_report)
+    return df
+
+
+def summarize_report(report_file, started, workers=1, tabs=1, baseline_report=None):
+    """Baca laporan yang ditulis per baris, tambah kolom turunan, cetak ringkasan."""
+    elapsed = time.time() - started
+    if not os.path.exists(report_file):
+        print("\n  Belum ada tempat yang selesai, laporan tidak dibuat")
+        return pd.DataFrame()
+    df = pd.read_csv(report_file, encoding="utf-8-sig")
+    df["reviews_per_sec"] = (df["reviews"] / df["seconds"].where(df["seconds"] > 0)).round(2)
+    if baseline_report and "page_kb" in df:
+        baseline = pd.read_csv(baseline_report, encoding="utf-8-sig").dropna(subset=["page_kb"])
+        baseline_kb = baseline.groupby("output")["page_kb"].mean()
+        df["page_kb_saved"] = (df["output"].map(baseline_kb) - df["page_kb"]).round(1)
+    df.to_csv(report_file, index=False, encoding="utf-8-sig")
+
+    total_reviews = int(df["reviews"].sum())
+    print("\n" + "="*60)
+    print("BATCH SELESAI")
+    print("="*60)
+    print(f"Tempat: {len(df)} | Berhasil: {(df['status'] == 'ok').sum()} | Dilewati/gagal: {(df['status'] != 'ok').sum()}")
+    print(f"Total ulasan: {total_reviews}")
+    if "page_kb" in df and df["page_kb"].notna().any():
+        print(f"Data diterima: rata-rata {df['page_kb'].mean():.0f} KB/tempat")
+    if "blocked_requests" in df and df["blocked_requests"].notna().any():
+        print(f"Request diblokir: rata-rata {df['blocked_requests'].mean():.0f}/tempat")
+    if "page_kb_saved" in df and df["page_kb_saved"].notna().any():
+        print(f"Hemat vs baseline: rata-rata {df['page_kb_saved'].mean():.0f} KB/tempat")
+    print(f"Durasi: {elapsed / 60:.1f} menit | {total_reviews / elapsed if elapsed else 0:.2f} ulasan/detik | Worker: {workers} | Tab: {tabs}")
+    if "peak_rss_mb" in df and df["peak_rss_mb"].notna().any():
+        per_worker = df.groupby("worker").agg(cpu_seconds=("cpu_seconds", "sum"), peak_rss_mb=("peak_rss_mb", "max"))
+        print("\nPer worker (CPU detik, puncak RSS MB):")
+        print(per_worker.to_string())
+    print(f"Laporan: {report_file}")
+    print("="*60 + "\n")
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraping semua tempat wisata di katalog Excel")
+    parser.add_argument("--catalog", default=CATALOG_FILE)
+    parser.add_argument("--base-dir", default=BASE_DIR)
+    parser.add_argument("--daerah", nargs="*", help="Hanya daerah tertentu, mis. --daerah Bangkalan Lamongan")
+    parser.add_argument("--limit", type=int, help="Maksimal jumlah tempat")
+    parser.add_argument("--overwrite", action="store_true", help="Scrape ulang walau CSV sudah ada")
+    parser.add_argument("--resume", action="store_true", help="Lanjutkan tempat yang punya checkpoint")
+    parser.add_argument("--refresh", action="store_true", help="CSV yang sudah ada: ambil ulasan baru saja")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--login-time", type=int, default=60, help="Waktu login manual bila profil belum login")
+    parser.add_argument("--years-back", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah Chrome paralel (1 proses per worker)")
+    parser.add_argument("--tabs", type=int, default=1, help="Jumlah tab (tempat) sekaligus per Chrome")
+    parser.add_argument("--profile-root", default=PROFILE_ROOT, help="Folder profil Chrome per worker (login tersimpan antar run)")
+    parser.add_argument("--server", action="store_true", help="Profil Chrome ramping untuk VPS (headless, tanpa GPU)")
+    parser.add_argument("--block-resources", action="store_true", help="Blokir tile peta, foto, font, media")
+    parser.add_argument("--baseline-report", help="Laporan run sebelumnya untuk hitung page_kb_saved")
+    parser.add_argument("--report", default=f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
+    args = parser.parse_args()
+
+    places = load_catalog(args.catalog)
+    if args.daerah:
+        places = [p for p in places if p["daerah"] in args.daerah]
+    if args.limit:
+        places = places[:args.limit]
+
+    print(f" BATCH SCRAPING: {len(places)} tempat ({sum(1 for p in places if p['url'])} dengan link)")
+
+    run_batch(
+        places,
+        base_dir=args.base_dir,
+        overwrite=args.overwrite,
+        resume=args.resume,
+        refresh=args.refresh,
+        report_file=args.report,
+        workers=args.workers,
+        profile_root=args.profile_root,
+        tabs=args.tabs,
+        baseline_report=args.baseline_report,
+        block_resources=args.block_resources,
+        server_profile=args.server,
+        headless=args.headless,
+        login_time=args.login_time,
+        years_back=args.years_back,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import argparse
+import pandas as pd
+from datetime import datetime
+
+from batch_scrape import CATALOG_FILE, PROFILE_ROOT, load_catalog, run_batch, psutil
+
+# Opsi Chrome yang dibandingkan (diteruskan ke scrape_reviews)
+PROFILES = {
+    "default": dict(headless=True),
+    "server": dict(server_profile=True),
+    "server+block": dict(server_profile=True, block_resources=True),
+}
+
+
+def run_benchmark(places, profiles, out_dir, profile_root=PROFILE_ROOT, **scrape_kwargs):
+    """Scrape tempat yang sama dengan tiap profil, kembalikan tabel perbandingan."""
+    rows = []
+    for name, options in profiles.items():
+        base_dir = os.path.join(out_dir, name.replace("+", "_"))
+        df = run_batch(
+            places,
+            base_dir=base_dir,
+            overwrite=True,
+            report_file=os.path.join(out_dir, f"report_{name.replace('+', '_')}.csv"),
+            profile_root=profile_root,
+            **options,
+            **scrape_kwargs,
+        )
+        ok = df[df["status"] == "ok"]
+        seconds = ok["seconds"].sum()
+        rows.append({
+            "profile": name,
+            "places": len(ok),
+            "reviews": int(ok["reviews"].sum()),
+            "seconds": round(seconds, 1),
+            "reviews_per_sec": round(ok["reviews"].sum() / seconds, 2) if seconds else None,
+            "peak_rss_mb": ok["peak_rss_mb"].max() if "peak_rss_mb" in ok else None,
+            "cpu_seconds": round(ok["cpu_seconds"].sum(), 1) if ok["cpu_seconds"].notna().any() else None,
+            "page_kb_avg": round(ok["page_kb"].mean(), 1) if ok["page_kb"].notna().any() else None,
+            "blocked_avg": round(ok["blocked_requests"].mean(), 1) if ok["blocked_requests"].notna().any() else None,
+        })
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bandingkan ulasan/detik dan RSS antar profil Chrome")
+    parser.add_argument("--catalog", default=CATALOG_FILE)
+    parser.add_argument("--daerah", nargs="*")
+    parser.add_argument("--limit", type=int, default=3, help="Jumlah tempat per profil")
+    parser.add_argument("--max-reviews", type=int, default=300, help="Batas ulasan per tempat")
+    parser.add_argument("--years-back", type=int, default=5)
+    parser.add_argument("--profiles", nargs="*", default=list(PROFILES), choices=list(PROFILES))
+    parser.add_argument("--profile-root", default=PROFILE_ROOT)
+    parser.add_argument("--out-dir", default=f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    args = parser.parse_args()
+
+    if not psutil:
+        print("  psutil tidak terpasang: RSS dan CPU tidak diukur (pip install psutil)")
+
+    places = [p for p in load_catalog(args.catalog) if p["url"] and p["region_no"]]
+    if args.daerah:
+        places = [p for p in places if p["daerah"] in args.daerah]
+    places = places[:args.limit]
+
+    print(f" BENCHMARK: {len(places)} tempat x {len(args.profiles)} profil")
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    result = run_benchmark(
+        places,
+        {name: PROFILES[name] for name in args.profiles},
+        args.out_dir,
+        profile_root=args.profile_root,
+        max_reviews=args.max_reviews,
+        years_back=args.years_back,
+        login_time=0,  # Profil harus sudah login (jalankan batch_scrape sekali)
+    )
+    result.to_csv(os.path.join(args.out_dir, "summary.csv"), index=False, encoding="utf-8-sig")
+
+    print("\n" + "="*60)
+    print("HASIL BENCHMARK")
+    print("="*60)
+    print(result.to_string(index=False))
+    print(f"\nDetail: {args.out_dir}")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,21 @@
 import time
 import re
+import os
+import csv
+import json
+import base64
+import http.client
 import argparse
+import numpy as np
 import pandas as pd
 import random
 import signal
 import sys
+import shutil
+import subprocess
 from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import urlsplit, quote
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -16,8 +26,156 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from webdriver_manager.chrome import ChromeDriverManager
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+
+class StreamingReviewSink:
+    """Tulis ulasan ke CSV/JSONL secara bertahap supaya run yang mati tetap menyisakan data.
+
+    Record ditulis ke `<path>.partial`, ditampung di buffer kecil, ditulis
+    ke file setiap `buffer_size` record atau saat flush() (akhir tiap parse
+    batch), lalu di-fsync paling lama setiap `fsync_interval` detik. File
+    `path` baru diganti saat close(), jadi run yang gagal sebelum ada data
+    tidak mengosongkan hasil lama. Dengan `append`, .partial sisa run yang
+    mati (atau isi `path`) dilanjutkan; tanpa `append`, .partial tersebut
+    dipindah ke cadangan `.partial.<waktu>.bak`, tidak pernah dikosongkan.
+    """
+
+    def __init__(self, path, append=False, buffer_size=50, fsync_interval=5.0):
+        self.path = path
+        self.partial_path = f"{path}.partial"
+        self.format = "jsonl" if str(path).lower().endswith(".jsonl") else "csv"
+        self.append = append
+        self.buffer_size = buffer_size
+        self.fsync_interval = fsync_interval
+        self.buffer = []
+        self.fieldnames = None
+        self.writer = None
+        self.written = 0
+        self.last_fsync = time.time()
+
+        if append and not os.path.exists(self.partial_path) and os.path.exists(path):
+            # Lanjutkan hasil run sebelumnya yang sudah selesai ditutup
+            shutil.copyfile(path, self.partial_path)
+
+        if not append and self._has_data():
+            # Sisa run yang mati tanpa --resume: simpan, jangan ditimpa
+            backup = f"{self.partial_path}.{datetime.now().strftime('%Y%m%d_%H%M%S')}.bak"
+            os.replace(self.partial_path, backup)
+            print(f"  {self.partial_path} dari run sebelumnya dipindah ke {backup} (pakai --resume untuk melanjutkan)")
+
+        if append and self.format == "csv" and self._has_data():
+            # Lanjutkan file lama: pakai header yang sudah ada
+            with open(self.partial_path, encoding="utf-8-sig", newline="") as f:
+                self.fieldnames = next(csv.reader(f), None)
+
+        self.file = self._open("a" if append else "w")
+
+    def _has_data(self):
+        return os.path.exists(self.partial_path) and os.path.getsize(self.partial_path) > 0
+
+    def _open(self, mode):
+        encoding = "utf-8-sig" if self.format == "csv" else "utf-8"
+        return open(self.partial_path, mode, encoding=encoding, newline="")
+
+    def _extend_header(self, new_fields):
+        """Kolom baru (mis. file lama tanpa review_id): tulis ulang file dengan header gabungan."""
+        self.file.close()
+        with open(self.partial_path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.fieldnames = self.fieldnames + new_fields
+        tmp_path = f"{self.partial_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, self.partial_path)
+        self.file = self._open("a")
+        self.writer = None
+
+    def write(self, record):
+        self.buffer.append(record)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self, sync=False):
+        if self.file.closed:
+            return
+        if self.buffer:
+            if self.format == "jsonl":
+                self.file.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in self.buffer)
+            else:
+                if self.fieldnames is not None:
+                    new_fields = []
+                    for record in self.buffer:
+                        for key in record:
+                            if key not in self.fieldnames and key not in new_fields:
+                                new_fields.append(key)
+                    if new_fields:
+                        self._extend_header(new_fields)
+                if self.writer is None:
+                    write_header = self.fieldnames is None
+                    if write_header:
+                        self.fieldnames = list(self.buffer[0].keys())
+                    self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames,
+                                                 lineterminator="\n")
+                    if write_header:
+                        self.writer.writeheader()
+                self.writer.writerows(self.buffer)
+            self.written += len(self.buffer)
+            self.buffer.clear()
+
+        self.file.flush()
+        if sync or time.time() - self.last_fsync >= self.fsync_interval:
+            os.fsync(self.file.fileno())
+            self.last_fsync = time.time()
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush(sync=True)
+        self.file.close()
+        if self.written or (self.append and self._has_data()):
+            os.replace(self.partial_path, self.path)
+        elif os.path.exists(self.partial_path):
+            os.remove(self.partial_path)  # Tidak ada data: file lama dibiarkan utuh
+
+
+class ReviewCollector:
+    """Penampung ulasan append-only yang dipegang bersama scraper dan signal handler.
+
+    Tanpa sink, record disimpan di memori (`records`) dan save_temp_data
+    membaca objek yang sama, jadi tidak perlu copy per ulasan. Dengan sink,
+    record langsung diteruskan ke file dan hanya jumlahnya yang disimpan.
+    """
+
+    def __init__(self, sink=None):
+        self.records = []
+        self.sink = sink
+        self.count = 0
+        self.page_bytes = None  # Diisi scraper: byte yang diterima halaman tempat
+        self.blocked_requests = None  # Diisi scraper: request yang diblokir (block_resources)
+
+    def append(self, record):
+        if self.sink:
+            self.sink.write(record)
+        else:
+            self.records.append(record)
+        self.count += 1
+
+    def __len__(self):
+        return self.count
+
+    def flush(self):
+        if self.sink:
+            self.sink.flush()
+
+    def close(self):
+        if self.sink:
+            self.sink.close()
+
+
 # Global variables untuk menyimpan data sementara
-TEMP_DATA = []
+TEMP_DATA = ReviewCollector()
 TEMP_OUTPUT_FILE = ""
 DRIVER_INSTANCE = None
 
@@ -25,8 +183,18 @@ def save_temp_data():
     """Simpan data sementara ke CSV saat interupsi"""
     global TEMP_DATA, TEMP_OUTPUT_FILE, DRIVER_INSTANCE
     
-    if len(TEMP_DATA) > 0:
-        df = pd.DataFrame(TEMP_DATA)
+    if TEMP_DATA.sink and len(TEMP_DATA) > 0:
+        # Mode streaming: data sudah di disk, cukup flush sisa buffer
+        TEMP_DATA.close()
+        print(f"\n{'='*60}")
+        print("  PROSES DIHENTIKAN - DATA OTOMATIS TERSIMPAN")
+        print(f"{'='*60}")
+        print(f"✓ File: {TEMP_DATA.sink.path}")
+        print(f"✓ Total: {len(TEMP_DATA)} ulasan")
+        print(f"{'='*60}\n")
+        return TEMP_DATA.sink.path
+    elif len(TEMP_DATA) > 0:
+        df = pd.DataFrame(TEMP_DATA.records)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = TEMP_OUTPUT_FILE or f"backup_reviews_{timestamp}.csv"
         df.to_csv(output_file, index=False, encoding="utf-8-sig")
@@ -66,28 +234,149 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 
+# Evaluasi semua kandidat XPath di halaman sekaligus; bila belum ada, tunggu
+# lewat MutationObserver (bukan polling find_element + sleep dari Python).
+# Hasil: {index, clicked}; index -1 bila timeout, clicked false bila elemen
+# tidak bisa diklik lewat JS (diklik native dari Python).
+CLICK_FIRST_JS = """
+const xpaths = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+
+function findFirst() {
+    for (let i = 0; i < xpaths.length; i++) {
+        const snap = document.evaluate(xpaths[i], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let j = 0; j < snap.snapshotLength; j++) {
+            const el = snap.snapshotItem(j);
+            if (el.getClientRects().length) return [el, i];  // Hanya elemen yang tampil
+        }
+    }
+    return null;
+}
+
+function tryClick() {
+    const found = findFirst();
+    if (!found) return null;
+    const [el, i] = found;
+    el.scrollIntoView({block: 'center'});
+    if (typeof el.click !== 'function') return {index: i, clicked: false};
+    el.click();
+    return {index: i, clicked: true};
+}
+
+new Promise((resolve) => {
+    const first = tryClick();
+    if (first) return resolve(first);
+
+    let pending = false;
+    const observer = new MutationObserver(() => {
+        if (pending) return;
+        pending = true;  // Gabungkan rentetan mutasi jadi 1 evaluasi
+        setTimeout(() => {
+            pending = false;
+            let result;
+            try {
+                result = tryClick();
+            } catch (e) {
+                result = {index: -1, clicked: false};  // Jangan biarkan done tak terpanggil
+            }
+            if (result) finish(result);
+        }, 0);
+    });
+    const timer = setTimeout(() => finish({index: -1, clicked: false}), timeoutMs);
+    function finish(result) {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(result);
+    }
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+}).then(done).catch(() => done({index: -1, clicked: false}));
+"""
+
+
 def click_first(driver, xpaths, timeout=5):
-    """Klik elemen pertama yang ketemu dari daftar XPATH."""
+    """Klik elemen pertama yang ketemu dari daftar XPATH.
+
+    Semua kandidat dievaluasi di halaman dalam 1 panggilan dan diklik begitu
+    muncul. Mengembalikan XPath yang menang, None bila tidak ada sampai timeout.
+    """
     end = time.time() + timeout
     while time.time() < end:
-        for xp in xpaths:
+        remaining = end - time.time()
+        try:
+            result = driver.execute_async_script(CLICK_FIRST_JS, xpaths, int(remaining * 1000))
+        except Exception:
+            # Halaman sedang berpindah (mis. redirect login), coba lagi di dokumen baru
+            time.sleep(0.1)
+            continue
+        index = (result or {}).get("index", -1)
+        if index < 0:
+            return None
+        if not result.get("clicked"):
             try:
-                el = driver.find_element(By.XPATH, xp)
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-                time.sleep(0.1)
-                el.click()
-                return True
+                driver.find_element(By.XPATH, xpaths[index]).click()
             except Exception:
-                pass
-        time.sleep(0.1)
-    return False
+                time.sleep(0.1)
+                continue
+        return xpaths[index]
+    return None
+
+
+# Scroll lalu tunggu kartu ulasan baru lewat MutationObserver (bukan sleep tetap).
+# Callback dipanggil begitu ada kartu baru, atau false setelah timeout.
+SCROLL_AND_WAIT_JS = """
+const feed = arguments[0];
+const sel = arguments[1];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+
+let finished = false;
+let timer = null;
+const observer = new MutationObserver((mutations) => {
+    for (const m of mutations) {
+        for (const n of m.addedNodes) {
+            if (n.nodeType === 1 && (n.matches(sel) || n.querySelector(sel))) {
+                finish(true);
+                return;
+            }
+        }
+    }
+});
+
+function finish(arrived) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    done(arrived);
+}
+
+observer.observe(feed, {childList: true, subtree: true});
+timer = setTimeout(() => finish(false), timeoutMs);
+feed.scrollTop = feed.scrollHeight;
+"""
+
 
+def fast_scroll(driver, element, times=2, timeout=2.0):
+    """Scroll cepat tanpa animasi - lanjut begitu kartu baru muncul.
 
-def fast_scroll(driver, element, times=2):
-    """Scroll cepat tanpa animasi - multiple scrolls sekaligus"""
+    Mengembalikan (scroll yang dicoba, scroll yang memunculkan kartu baru).
+    Berhenti lebih awal bila satu scroll tidak memunculkan apa pun sampai
+    timeout; scroll yang timeout itu tetap terhitung dicoba.
+    """
+    attempted = 0
+    arrived_count = 0
     for _ in range(times):
-        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", element)
-        time.sleep(0.15)  # Delay lebih singkat per scroll
+        attempted += 1
+        arrived = driver.execute_async_script(
+            SCROLL_AND_WAIT_JS, element,
+            f"{REVIEW_CARD_SELECTOR}, {REVIEW_CARD_FALLBACK_SELECTOR}",
+            int(timeout * 1000),
+        )
+        if not arrived:
+            break
+        arrived_count += 1
+    return attempted, arrived_count
 
 
 def human_like_scroll(driver, element, pause_time=0.5):
@@ -101,29 +390,480 @@ def random_sleep(min_sec=0.1, max_sec=0.3):
     time.sleep(random.uniform(min_sec, max_sec))
 
 
-def safe_text(parent, css_list):
-    """Ambil text pertama yang ketemu dari beberapa selector CSS."""
-    for css in css_list:
+def safe_text(parent, css_list, field=None):
+    """Ambil text pertama yang ketemu dari beberapa selector CSS.
+
+    Dengan `field`, urutan selector diambil dari SELECTOR_REGISTRY (yang
+    paling sering kena dicoba dulu) dan hasilnya dicatat.
+    """
+    if field:
+        css_list = SELECTOR_REGISTRY.order(field)
+    for i, css in enumerate(css_list):
         try:
             t = parent.find_element(By.CSS_SELECTOR, css).text.strip()
             if t:
+                if field:
+                    SELECTOR_REGISTRY.record(field, css_list, i)
                 return t
         except Exception:
             pass
+    if field:
+        SELECTOR_REGISTRY.record(field, css_list, -1)
     return ""
 
 
-def safe_attr(parent, css_list, attr):
-    for css in css_list:
+def safe_attr(parent, css_list, attr, field=None):
+    if field:
+        css_list = SELECTOR_REGISTRY.order(field)
+    for i, css in enumerate(css_list):
         try:
             v = parent.find_element(By.CSS_SELECTOR, css).get_attribute(attr)
             if v:
+                if field:
+                    SELECTOR_REGISTRY.record(field, css_list, i)
                 return v.strip()
         except Exception:
             pass
+    if field:
+        SELECTOR_REGISTRY.record(field, css_list, -1)
     return ""
 
 
+# Selector CSS per field ulasan, dipakai jalur WebDriver maupun jalur JS
+REVIEW_CARD_SELECTOR = "div[data-review-id]"
+REVIEW_CARD_FALLBACK_SELECTOR = "div[role='article']"
+
+NAME_SELECTORS = [
+    "div.d4r55", "span.d4r55",
+    "a[href*='maps/contrib']",
+]
+
+RATING_SELECTORS = [
+    "span.kvMYJc",
+    "span[role='img']",
+    "span[aria-label*='bintang']",
+    "span[aria-label*='stars']",
+]
+
+DATE_SELECTORS = [
+    "span.rsqaWe",
+]
+
+TEXT_SELECTORS = [
+    "span.wiI7pd",
+    "div.MyEned",
+    "span.MyEned",
+]
+
+
+class FileLock:
+    """Kunci antar proses berbasis file `<path>.lock` (os.O_EXCL), tanpa dependensi tambahan.
+
+    Kunci yang tertinggal lebih lama dari `stale_after` detik (proses mati)
+    dianggap basi dan dihapus.
+    """
+
+    def __init__(self, path, timeout=10.0, stale_after=60.0, poll_interval=0.05):
+        self.lock_path = f"{path}.lock"
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self.fd = None
+
+    def __enter__(self):
+        end = time.time() + self.timeout
+        while True:
+            try:
+                self.fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self.fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.lock_path) > self.stale_after:
+                        os.remove(self.lock_path)
+                        continue
+                except OSError:
+                    continue  # Baru dilepas proses lain, coba lagi
+                if time.time() >= end:
+                    raise TimeoutError(f"Kunci {self.lock_path} tidak didapat dalam {self.timeout:.0f} detik")
+                time.sleep(self.poll_interval)
+
+    def __exit__(self, *exc):
+        os.close(self.fd)
+        self.fd = None
+        try:
+            os.remove(self.lock_path)
+        except OSError:
+            pass
+
+
+class SelectorRegistry:
+    """Statistik kena/gagal tiap selector per field, dipakai bersama jalur WebDriver dan JS.
+
+    Selector yang paling sering kena dipindah ke depan selama run. Statistik
+    disimpan antar run (`save`/`load`), jadi perubahan class Maps terlihat
+    sebagai hit rate yang turun, bukan lonjakan `skipped_count` tanpa sebab.
+    """
+
+    def __init__(self, fields):
+        self.selectors = {field: list(css_list) for field, css_list in fields.items()}
+        self.history = {field: {} for field in fields}  # Total dari run sebelumnya
+        self.run = {field: {} for field in fields}  # Run ini: {css: [kena, gagal]}
+        self.run_tries = {field: [0, 0] for field in fields}  # [kartu, kartu tanpa hasil]
+        self.history_tries = {field: [0, 0] for field in fields}
+
+    def hits(self, field, css):
+        return self.history[field].get(css, [0, 0])[0] + self.run[field].get(css, [0, 0])[0]
+
+    def order(self, field):
+        return self.selectors[field]
+
+    def record(self, field, css_list, index):
+        """Catat hasil 1 kartu: selector ke-`index` kena (sebelumnya gagal), -1 bila semua gagal."""
+        tried = css_list if index < 0 else css_list[:index + 1]
+        for i, css in enumerate(tried):
+            counts = self.run[field].setdefault(css, [0, 0])
+            counts[0 if i == index else 1] += 1
+        self.run_tries[field][0] += 1
+        if index < 0:
+            self.run_tries[field][1] += 1
+        elif index > 0 and self.hits(field, css_list[index]) > self.hits(field, self.selectors[field][0]):
+            self._reorder(field)
+
+    def _reorder(self, field):
+        # sorted() stabil: urutan kode jadi penentu saat jumlah kena sama
+        self.selectors[field].sort(key=lambda css: -self.hits(field, css))
+
+    def load(self, path):
+        saved = load_checkpoint(path) or {}
+        for field in self.selectors:
+            entry = saved.get(field, {})
+            self.history[field] = {css: list(c) for css, c in entry.get("selectors", {}).items()}
+            self.history_tries[field] = list(entry.get("tries", [0, 0]))
+            self._reorder(field)
+
+    def save(self, path):
+        """Tambahkan statistik run ini ke file; baca-ubah-tulis di bawah FileLock agar worker paralel tidak saling timpa."""
+        with FileLock(path):
+            saved = load_checkpoint(path) or {}
+            state = self._merged(saved)
+            tmp_path = f"{path}.{os.getpid()}.tmp"  # Per proses, bukan .tmp bersama
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({**state, "updated_at": datetime.now().isoformat(timespec="seconds")}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        # Statistik run baru dipindah ke history setelah file benar-benar tertulis
+        for field in self.selectors:
+            self.history[field] = state[field]["selectors"]
+            self.history_tries[field] = state[field]["tries"]
+            self.run[field] = {}
+            self.run_tries[field] = [0, 0]
+
+    def _merged(self, saved):
+        state = {}
+        for field in self.selectors:
+            entry = saved.get(field, {})
+            selectors = {css: list(c) for css, c in entry.get("selectors", {}).items()}
+            for css, (hit, miss) in self.run[field].items():
+                counts = selectors.setdefault(css, [0, 0])
+                counts[0] += hit
+                counts[1] += miss
+            tries = list(entry.get("tries", [0, 0]))
+            tries[0] += self.run_tries[field][0]
+            tries[1] += self.run_tries[field][1]
+            state[field] = {"selectors": selectors, "tries": tries}
+        return state
+
+    def save_safely(self, path):
+        """save() untuk blok finally: kegagalan hanya dicetak, pembersihan tetap jalan."""
+        try:
+            self.save(path)
+        except Exception as e:
+            print(f"  Statistik selector tidak tersimpan: {e}")
+
+    def report(self, drop_threshold=0.2, min_tries=20):
+        """Cetak hit rate run ini vs run sebelumnya per field dan selector."""
+        print("Hit rate selector (run ini | sebelumnya):")
+        for field, css_list in self.selectors.items():
+            tries, empty = self.run_tries[field]
+            h_tries, h_empty = self.history_tries[field]
+            if not tries:
+                continue
+            rate = 1 - empty / tries
+            line = f"- {field}: {rate:.0%} dari {tries} kartu"
+            if h_tries:
+                h_rate = 1 - h_empty / h_tries
+                line += f" | {h_rate:.0%}"
+                if tries >= min_tries and rate < h_rate - drop_threshold:
+                    line += "  ⚠ TURUN, cek selector"
+            print(line)
+            for css in css_list:
+                hit, miss = self.run[field].get(css, [0, 0])
+                if hit or miss:
+                    print(f"    {css}: {hit} kena, {miss} gagal")
+
+
+REVIEW_FIELDS = ["name", "rating", "date", "text"]
+
+SELECTOR_STATS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "selector_stats.json")
+
+SELECTOR_REGISTRY = SelectorRegistry({
+    "name": NAME_SELECTORS,
+    "rating": RATING_SELECTORS,
+    "date": DATE_SELECTORS,
+    "text": TEXT_SELECTORS,
+})
+
+# Kursor DOM: kunjungi hanya kartu setelah kartu terakhir yang sudah diproses
+# (urutan dokumen), jadi biaya per pass tidak tumbuh seiring panjang feed.
+COLLECT_NEW_CARDS_JS = """
+function collectNewCards(feed, sel, fallback, peek) {
+    let cardSel = feed.__cardSelector;
+    if (!cardSel) {
+        if (feed.querySelector(sel)) cardSel = sel;
+        else if (feed.querySelector(fallback)) cardSel = fallback;
+        else return [];
+        feed.__cardSelector = cardSel;
+    }
+
+    const out = [];
+    const take = (node) => {
+        if (node.matches(cardSel)) {
+            out.push(node);
+            return;
+        }
+        for (const c of node.querySelectorAll(cardSel)) {
+            // Hanya kartu terluar (data-review-id juga ada di elemen anak)
+            if (!c.parentElement.closest(cardSel)) out.push(c);
+        }
+    };
+
+    let node = feed.__lastCard;
+    if (!node || !feed.contains(node)) {
+        // Belum ada kursor / kursor terlepas dari DOM: scan dari awal
+        for (const child of feed.children) take(child);
+    } else {
+        while (node && node !== feed) {
+            for (let sib = node.nextElementSibling; sib; sib = sib.nextElementSibling) take(sib);
+            node = node.parentElement;
+        }
+    }
+
+    // peek: hanya lihat kartu baru tanpa memajukan kursor
+    if (peek) return out;
+    if (out.length) feed.__lastCard = out[out.length - 1];
+    if (feed.__prune) feed.__harvested = (feed.__harvested || []).concat(out);
+    return out;
+}
+"""
+
+# Kosongkan isi kartu yang sudah diekstrak, tapi pertahankan tingginya supaya
+# scrollHeight feed tetap sama dan Maps tetap memuat halaman berikutnya.
+# Node kartu (dan data-review-id) tetap ada agar kursor tidak terlepas.
+PRUNE_HARVESTED_JS = """
+const feed = arguments[0];
+feed.__prune = true;
+const cards = feed.__harvested || [];
+feed.__harvested = [];
+let pruned = 0;
+for (const card of cards) {
+    if (!card.isConnected || card.__pruned) continue;
+    const h = card.getBoundingClientRect().height;
+    card.replaceChildren();
+    card.style.height = h + 'px';
+    card.style.padding = '0';
+    card.style.border = '0';
+    card.style.boxSizing = 'border-box';
+    card.__pruned = true;
+    pruned++;
+}
+return pruned;
+"""
+
+# Ekstrak semua kartu baru dalam 1x execute_script (tanpa round trip per field)
+EXTRACT_REVIEWS_JS = COLLECT_NEW_CARDS_JS + """
+const feed = arguments[0];
+const sel = arguments[1];
+
+// Kembalikan [nilai, index selector yang kena] untuk statistik selector
+function firstText(card, list) {
+    for (let i = 0; i < list.length; i++) {
+        const el = card.querySelector(list[i]);
+        if (el) {
+            const t = (el.innerText || '').trim();
+            if (t) return [t, i];
+        }
+    }
+    return ['', -1];
+}
+
+function firstAttr(card, list, attr) {
+    for (let i = 0; i < list.length; i++) {
+        const el = card.querySelector(list[i]);
+        if (el) {
+            const v = el.getAttribute(attr);
+            if (v) return [v.trim(), i];
+        }
+    }
+    return ['', -1];
+}
+
+const out = [];
+for (const card of collectNewCards(feed, sel.card, sel.fallback)) {
+    const rid = card.getAttribute('data-review-id') || '';
+    const name = firstText(card, sel.name);
+    const rating = firstAttr(card, sel.rating, 'aria-label');
+    const date = firstText(card, sel.date);
+    const text = firstText(card, sel.text);
+    out.push({
+        id: rid,
+        signature: rid || (card.innerText || '').slice(0, 120).trim(),
+        name: name[0],
+        rating_aria: rating[0],
+        date: date[0],
+        text: text[0],
+        hits: [name[1], rating[1], date[1], text[1]],
+    });
+}
+return out;
+"""
+
+
+def collect_new_cards(driver, feed):
+    """Ambil WebElement kartu ulasan yang muncul setelah kursor terakhir."""
+    return driver.execute_script(
+        COLLECT_NEW_CARDS_JS + "return collectNewCards(arguments[0], arguments[1], arguments[2]);",
+        feed, REVIEW_CARD_SELECTOR, REVIEW_CARD_FALLBACK_SELECTOR,
+    ) or []
+
+
+def read_review_card(it, seen):
+    """Baca 1 kartu ulasan lewat WebDriver (1 round trip per selector)."""
+    rid = it.get_attribute("data-review-id") or ""
+    signature = rid or (it.text[:120].strip())
+    if not signature or signature in seen:
+        return None
+
+    return {
+        "id": rid,
+        "signature": signature,
+        "name": safe_text(it, NAME_SELECTORS, field="name"),
+        "rating_aria": safe_attr(it, RATING_SELECTORS, "aria-label", field="rating"),
+        "date": safe_text(it, DATE_SELECTORS, field="date"),
+        "text": safe_text(it, TEXT_SELECTORS, field="text"),
+    }
+
+
+def prune_harvested_cards(driver, feed):
+    """Kosongkan kartu yang sudah diekstrak. Panggilan pertama hanya mengaktifkan pelacakan."""
+    return driver.execute_script(PRUNE_HARVESTED_JS, feed) or 0
+
+
+def extract_reviews_batch(driver, feed):
+    """Ambil semua kartu ulasan baru (sejak kursor) dalam 1 round trip JS."""
+    orders = {field: list(SELECTOR_REGISTRY.order(field)) for field in REVIEW_FIELDS}
+    cards = driver.execute_script(EXTRACT_REVIEWS_JS, feed, {
+        "card": REVIEW_CARD_SELECTOR,
+        "fallback": REVIEW_CARD_FALLBACK_SELECTOR,
+        **orders,
+    }) or []
+    for card in cards:
+        # Index selector yang kena per field (-1 = tidak ada)
+        for field, index in zip(REVIEW_FIELDS, card.pop("hits", [])):
+            SELECTOR_REGISTRY.record(field, orders[field], index)
+    return cards
+
+
+# Satuan waktu per bahasa antarmuka Maps -> satuan baku. Tambah bahasa lewat
+# register_date_locale(); regex dan cache dibangun ulang otomatis.
+DATE_LOCALES = {
+    "id": {
+        "units": {"menit": "minute", "jam": "hour", "hari": "day", "minggu": "week",
+                  "bulan": "month", "tahun": "year"},
+        "one": ["se"],
+        "prefixes": ["diedit"],
+        "suffixes": ["yang lalu", "lalu"],
+    },
+    "en": {
+        "units": {"minute": "minute", "hour": "hour", "day": "day", "week": "week",
+                  "month": "month", "year": "year"},
+        "one": ["an", "a", "one"],
+        "prefixes": ["edited"],
+        "suffixes": ["ago"],
+    },
+    "jv": {
+        "units": {"menit": "minute", "jam": "hour", "dina": "day", "minggu": "week",
+                  "sasi": "month", "wulan": "month", "taun": "year"},
+        "one": ["sak", "se", "sa"],
+        "prefixes": ["diowahi"],
+        "suffixes": ["kepungkur", "kapungkur"],
+    },
+}
+
+# Panjang satuan baku dalam detik (bulan/tahun rata-rata kalender)
+UNIT_SECONDS = {
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 7 * 86400,
+    "month": 30.44 * 86400,
+    "year": 365.25 * 86400,
+}
+
+
+def _alternation(words):
+    # Kata terpanjang dulu supaya "yang lalu" menang atas "lalu"
+    return "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+
+
+def compile_relative_date_regex(locales):
+    """Satu regex untuk semua bahasa; satuan jadi named group (match.lastgroup)."""
+    words_by_unit = {unit: [] for unit in UNIT_SECONDS}
+    one_words, prefixes, suffixes = [], [], []
+    for locale in locales.values():
+        for word, unit in locale["units"].items():
+            words_by_unit[unit].append(word)
+        one_words += locale.get("one", [])
+        prefixes += locale.get("prefixes", [])
+        suffixes += locale.get("suffixes", [])
+
+    units = "|".join(f"(?P<{unit}>{_alternation(words)})" for unit, words in words_by_unit.items() if words)
+    pattern = (
+        rf"^(?:(?:{_alternation(prefixes)})\s+)?"
+        rf"(?P<num>\d+|{_alternation(one_words)})\s*"
+        rf"(?:{units})s?"
+        rf"(?:\s+(?:{_alternation(suffixes)}))?$"
+    )
+    return re.compile(pattern)
+
+
+RELATIVE_DATE_RE = compile_relative_date_regex(DATE_LOCALES)
+
+
+def register_date_locale(code, units, one=(), prefixes=(), suffixes=()):
+    """Tambah/ganti bahasa tanggal relatif, mis. register_date_locale("ms", {"tahun": "year"}, suffixes=["lepas"])."""
+    global RELATIVE_DATE_RE
+    DATE_LOCALES[code] = {"units": dict(units), "one": list(one),
+                          "prefixes": list(prefixes), "suffixes": list(suffixes)}
+    RELATIVE_DATE_RE = compile_relative_date_regex(DATE_LOCALES)
+    relative_age_seconds.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def relative_age_seconds(date_str):
+    """(umur minimum, umur maksimum) dalam detik untuk 1 teks tanggal relatif, None bila tidak dikenali.
+
+    Di-cache per string mentah: "2 minggu lalu" cukup di-parse sekali per run.
+    """
+    if not isinstance(date_str, str):
+        return None
+    match = RELATIVE_DATE_RE.match(date_str.strip().lower())
+    if not match:
+        return None
+    num = int(match["num"]) if match["num"].isdigit() else 1
+    unit_seconds = UNIT_SECONDS[match.lastgroup]
+    return num * unit_seconds, (num + 1) * unit_seconds
+
+
 def parse_date_to_datetime(date_str):
     """
     Konversi string tanggal Google Maps ke datetime object.
@@ -132,28 +872,59 @@ def parse_date_to_datetime(date_str):
         return None
     
     now = datetime.now()
-    date_str_lower = date_str.lower()
-    
-    match = re.search(r'(\d+)', date_str_lower)
-    if not match:
+    age = relative_age_seconds(date_str)
+    if not age:
         return now
-    
-    num = int(match.group(1))
-    
-    if 'tahun' in date_str_lower or 'year' in date_str_lower:
-        return now - timedelta(days=num * 365)
-    elif 'bulan' in date_str_lower or 'month' in date_str_lower:
-        return now - timedelta(days=num * 30)
-    elif 'minggu' in date_str_lower or 'week' in date_str_lower:
-        return now - timedelta(weeks=num)
-    elif 'hari' in date_str_lower or 'day' in date_str_lower:
-        return now - timedelta(days=num)
-    elif 'jam' in date_str_lower or 'hour' in date_str_lower:
-        return now - timedelta(hours=num)
-    elif 'menit' in date_str_lower or 'minute' in date_str_lower:
-        return now - timedelta(minutes=num)
-    
-    return now
+    return now - timedelta(seconds=age[0])
+
+
+def resolve_relative_dates(dates, anchor=None):
+    """Ubah satu kolom tanggal relatif Maps ke tanggal absolut sekaligus (vektor).
+
+    "N satuan lalu" dibulatkan ke bawah oleh Maps, jadi umur sebenarnya ada
+    di [N, N+1) satuan dari `anchor` (waktu scrape). `anchor` boleh satu waktu
+    atau Series per baris (file gabungan beberapa scrape). Hasil: DataFrame
+    dengan date_min/date_max (jendela), date_abs (titik tengah) dan
+    window_days. Teks yang tidak dikenali menjadi NaT.
+    """
+    dates = pd.Series(dates)
+    if isinstance(anchor, pd.Series):
+        anchor = pd.to_datetime(anchor.reindex(dates.index), errors="coerce").to_numpy()
+    else:
+        anchor = pd.Timestamp(anchor if anchor is not None else datetime.now())
+    # Satu kolom hanya berisi sedikit variasi teks: parse yang unik, lalu sebar per kode
+    codes, uniques = pd.factorize(dates.astype("string"))
+    ages = [relative_age_seconds(u) or (np.nan, np.nan) for u in uniques]
+    ages = np.array(ages + [(np.nan, np.nan)], dtype=float).reshape(-1, 2)  # Kode -1 (kosong) -> NaN
+    newest = ages[codes, 0]
+    oldest = ages[codes, 1]
+
+    date_min = anchor - pd.to_timedelta(oldest, unit="s")
+    date_max = anchor - pd.to_timedelta(newest, unit="s")
+    return pd.DataFrame({
+        "date_abs": date_min + (date_max - date_min) / 2,
+        "date_min": date_min,
+        "date_max": date_max,
+        "window_days": (oldest - newest) / 86400,
+    }, index=dates.index)
+
+
+def review_time_fields(date_str, captured_at, timestamp=""):
+    """Waktu scrape + jendela tanggal absolut (date_min/date_max) untuk 1 record.
+
+    Disimpan sebagai ISO string supaya filter berikutnya cukup membandingkan
+    string, tanpa parse ulang "N tahun lalu" terhadap waktu sekarang.
+    """
+    fields = {"scraped_at": captured_at.isoformat(timespec="seconds"), "date_min": "", "date_max": ""}
+    if timestamp:
+        # Payload RPC membawa waktu persis
+        fields["date_min"] = fields["date_max"] = timestamp
+        return fields
+    age = relative_age_seconds(date_str or "")
+    if age:
+        fields["date_min"] = (captured_at - timedelta(seconds=age[1])).isoformat(timespec="seconds")
+        fields["date_max"] = (captured_at - timedelta(seconds=age[0])).isoformat(timespec="seconds")
+    return fields
 
 
 def is_within_last_n_years(date_str, years=5):
@@ -181,12 +952,50 @@ def try_handle_consent(driver):
     ], timeout=4)
 
 
-def wait_for_manual_login(driver, timeout=60):
-    """Berikan waktu HANYA untuk login manual"""
+# Cookie sesi akun Google; ada bila profil Chrome sudah login
+AUTH_COOKIE_NAMES = {"SID", "SSID", "__Secure-1PSID", "__Secure-3PSID"}
+
+
+def is_logged_in(driver):
+    """Cek login lewat cookie sesi Google (tanpa menunggu elemen di halaman)."""
+    try:
+        names = {c.get("name") for c in driver.get_cookies()}
+    except Exception:
+        return False
+    return bool(names & AUTH_COOKIE_NAMES)
+
+
+def ensure_logged_in(driver, timeout=60, headless=False):
+    """Jalankan login manual hanya bila profil belum login."""
+    if is_logged_in(driver):
+        print("✓ Profil sudah login, langsung scraping\n")
+        return True
+    if headless or timeout <= 0:
+        print("  Profil belum login, lanjut tanpa login\n")
+        return False
+    return wait_for_manual_login(driver, timeout)
+
+
+# Avatar akun di pojok kanan atas Maps, muncul setelah login
+AVATAR_SELECTOR = "a[href*='accounts.google.com/SignOutOptions'], a[aria-label*='Akun Google'], a[aria-label*='Google Account']"
+
+
+def login_completed(driver):
+    """Login dianggap selesai bila avatar tampil, atau cookie sesi ada dan sudah kembali ke Maps."""
+    try:
+        if driver.find_elements(By.CSS_SELECTOR, AVATAR_SELECTOR):
+            return True
+        return is_logged_in(driver) and "/maps" in driver.current_url
+    except Exception:
+        return False
+
+
+def wait_for_manual_login(driver, timeout=60, poll_interval=1.0):
+    """Tunggu login manual; lanjut begitu login terdeteksi, `timeout` hanya batas atas."""
     print("\n" + "="*60)
     print("WAKTU LOGIN MANUAL")
     print("="*60)
-    print(f" Waktu: {timeout} detik")
+    print(f" Waktu maksimal: {timeout} detik (lanjut otomatis setelah login)")
     print(" Silakan:")
     print("   1. Login ke akun Google Anda")
     print("   2. Tunggu hingga halaman Maps terbuka penuh")
@@ -194,8 +1003,15 @@ def wait_for_manual_login(driver, timeout=60):
     print("\n  Tekan Ctrl+C kapan saja untuk menghentikan dan menyimpan data")
     print("="*60 + "\n")
     
-    time.sleep(timeout)
+    started = time.time()
+    deadline = started + timeout
+    while time.time() < deadline:
+        if login_completed(driver):
+            print(f"✓ Login terdeteksi setelah {time.time() - started:.0f} detik, memulai scraping...\n")
+            return True
+        time.sleep(poll_interval)
     print("✓ Waktu login selesai, memulai scraping...\n")
+    return False
 
 
 def open_reviews_panel(driver, wait):
@@ -236,8 +1052,13 @@ def open_reviews_panel(driver, wait):
     return feed
 
 
-def sort_reviews_newest(driver):
-    """Ubah urutan ulasan ke 'Terbaru/Newest'."""
+def sort_reviews_newest(driver, capture=None):
+    """Ubah urutan ulasan ke 'Terbaru/Newest'.
+
+    Dengan `capture`, respons RPC urutan lama (dimuat saat panel dibuka)
+    dibuang tepat sebelum 'Terbaru' diklik, supaya parse pertama dimulai
+    dari halaman terbaru.
+    """
     print(" Mengubah urutan ke 'Terbaru'...")
     
     clicked = click_first(driver, [
@@ -251,8 +1072,10 @@ def sort_reviews_newest(driver):
         print("  Tombol 'Urutkan' tidak ditemukan")
         return False
 
-    time.sleep(0.3)
-    
+    if capture:
+        capture.discard(driver)
+
+    # Menu ditunggu click_first sampai muncul, tanpa jeda tetap
     clicked_newest = click_first(driver, [
         "//*[@role='menu']//*[contains(.,'Terbaru')]/ancestor::*[@role='menuitemradio' or @role='menuitem']",
         "//*[@role='menu']//*[contains(.,'Newest')]/ancestor::*[@role='menuitemradio' or @role='menuitem']",
@@ -267,25 +1090,640 @@ def sort_reviews_newest(driver):
         return False
 
 
+def review_key(name, text):
+    """Kunci ulasan tanpa review_id (CSV lama): nama + awal teks, abaikan spasi dan '…'."""
+    text = re.sub(r"\s+", " ", str(text or "")).rstrip("… .").strip()
+    return f"{str(name or '').strip()}|{text[:60]}"
+
+
+def read_reviews_file(path):
+    if str(path).lower().endswith(".jsonl"):
+        return pd.read_json(path, lines=True, dtype=False)
+    return pd.read_csv(path, encoding="utf-8-sig", dtype=str, keep_default_na=False)
+
+
+def load_known_reviews(path):
+    """Set review_id + review_key dari file tempat yang sudah ada (untuk refresh)."""
+    if not path or not os.path.exists(path) or os.path.getsize(path) == 0:
+        return set()
+    df = read_reviews_file(path)
+    known = set()
+    if "review_id" in df:
+        known.update(rid for rid in df["review_id"].astype(str) if rid and rid != "nan")
+    if "name" in df and "text" in df:
+        known.update(review_key(n, t) for n, t in zip(df["name"], df["text"]))
+    return known
+
+
+def load_stream_state(path):
+    """(jumlah record, set review_id, review_id terakhir) dari file stream untuk resume."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return 0, set(), ""
+    df = read_reviews_file(path)
+    if "review_id" not in df:
+        return len(df), set(), ""
+    ids = [rid for rid in df["review_id"].astype(str) if rid and rid != "nan"]
+    return len(df), set(ids), ids[-1] if ids else ""
+
+
+def refresh_path(path):
+    """File sementara ulasan baru saat refresh, ekstensi tetap (format sink sama)."""
+    root, ext = os.path.splitext(path)
+    return f"{root}.refresh{ext}"
+
+
+def merge_refreshed_reviews(new_path, old_path):
+    """Taruh ulasan baru di atas file lama (urutan terbaru dulu), tulis atomik."""
+    if not os.path.exists(new_path):
+        return 0
+    if os.path.getsize(new_path) == 0:
+        os.remove(new_path)
+        return 0
+    new = read_reviews_file(new_path)
+    old = read_reviews_file(old_path)
+    merged = pd.concat([new, old], ignore_index=True)
+    tmp_path = f"{old_path}.tmp"
+    if str(old_path).lower().endswith(".jsonl"):
+        merged.to_json(tmp_path, orient="records", lines=True, force_ascii=False)
+    else:
+        merged.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, old_path)
+    os.remove(new_path)
+    return len(new)
+
+
+# Posisi scroll + jumlah kartu yang sudah termuat, untuk checkpoint
+FEED_STATE_JS = """
+const feed = arguments[0];
+const sel = feed.__cardSelector || arguments[1];
+return {scroll_top: feed.scrollTop, card_count: feed.querySelectorAll(sel).length};
+"""
+
+# Pindahkan kursor ke kartu dengan review id tertentu (tanpa ekstraksi).
+# Kartu pertama dalam urutan dokumen adalah kartu terluar.
+SEEK_CURSOR_JS = """
+const feed = arguments[0];
+const sel = arguments[1];
+const rid = arguments[2];
+const card = feed.querySelector(sel + '[data-review-id="' + CSS.escape(rid) + '"]');
+if (!card) return false;
+feed.__cardSelector = sel;
+feed.__lastCard = card;
+return true;
+"""
+
+
+# Kursor ke kartu terluar terakhir yang sudah termuat (id terakhir tidak ada di DOM)
+SEEK_LAST_CARD_JS = COLLECT_NEW_CARDS_JS + """
+return collectNewCards(arguments[0], arguments[1], arguments[2], false).length;
+"""
+
+
+def save_checkpoint(path, state):
+    """Tulis checkpoint secara atomik (file sementara lalu os.replace)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({**state, "updated_at": datetime.now().isoformat(timespec="seconds")}, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """Baca checkpoint, None bila belum ada atau rusak."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def catch_up_to_checkpoint(driver, feed, checkpoint, timeout=2.0, max_idle_scrolls=10, card_margin=20):
+    """Scroll cepat melewati area yang sudah diambil, tanpa ekstraksi.
+
+    Berhenti begitu kartu dengan review id terakhir di checkpoint termuat
+    (kursor langsung dipindah ke kartu itu), atau bila jumlah kartu sudah
+    menyamai `card_count` checkpoint (+ `card_margin` bila id dicari tapi
+    tidak muncul, mis. ulasan dihapus); kursor lalu dipindah ke kartu
+    terakhir yang termuat. Mengembalikan jumlah scroll yang dipakai.
+    """
+    last_id = checkpoint.get("last_review_id") or ""
+    target_cards = checkpoint.get("card_count") or 0
+    limit = target_cards + card_margin if last_id else target_cards
+    scrolls = 0
+    idle = 0
+
+    print(f" Catch-up: melewati {target_cards} kartu yang sudah diambil...")
+    while idle < max_idle_scrolls:
+        if last_id and driver.execute_script(SEEK_CURSOR_JS, feed, REVIEW_CARD_SELECTOR, last_id):
+            print(f"✓ Posisi terakhir ditemukan setelah {scrolls} scroll\n")
+            return scrolls
+        if target_cards or not last_id:
+            state = driver.execute_script(FEED_STATE_JS, feed, REVIEW_CARD_SELECTOR)
+            if state["card_count"] >= limit:
+                driver.execute_script(SEEK_LAST_CARD_JS, feed, REVIEW_CARD_SELECTOR, REVIEW_CARD_FALLBACK_SELECTOR)
+                if last_id:
+                    print(f"  Ulasan terakhir ({last_id}) tidak ada di feed, kursor ke kartu termuat terakhir")
+                print(f"✓ {state['card_count']} kartu termuat setelah {scrolls} scroll\n")
+                return scrolls
+
+        _, arrived = fast_scroll(driver, feed, times=1, timeout=timeout)
+        scrolls += 1
+        idle = 0 if arrived else idle + 1
+
+    print("  Posisi terakhir tidak ditemukan, lanjut dari posisi sekarang\n")
+    return scrolls
+
+
+MORE_BUTTON_LABELS = ["Lainnya", "More"]
+
+# Klik 'Lainnya/More' hanya di kartu yang belum diekstrak (setelah kursor),
+# dan hanya tombol yang belum pernah diklik. 1 round trip per pass.
+EXPAND_MORE_JS = COLLECT_NEW_CARDS_JS + """
+const feed = arguments[0];
+const sel = arguments[1];
+const fallback = arguments[2];
+const labels = arguments[3];
+
+const hasLabel = (s) => labels.some((l) => s.includes(l));
+let clicked = 0;
+for (const card of collectNewCards(feed, sel, fallback, true)) {
+    for (const b of card.querySelectorAll('button')) {
+        if (b.__expanded) continue;
+        const match = hasLabel(b.getAttribute('aria-label') || '') ||
+            Array.from(b.querySelectorAll('span')).some((sp) => hasLabel(sp.textContent || ''));
+        if (!match) continue;
+        b.__expanded = true;
+        try {
+            b.click();
+            clicked++;
+        } catch (e) {}
+    }
+}
+return clicked;
+"""
+
+
 def expand_more_buttons(driver, container):
-    """Klik 'Lainnya/More' dengan cara lebih cepat"""
-    xps = [
-        ".//button[.//span[contains(.,'Lainnya')]]",
-        ".//button[contains(@aria-label,'Lainnya')]",
-        ".//button[.//span[contains(.,'More')]]",
-        ".//button[contains(@aria-label,'More')]",
-    ]
-    for xp in xps:
+    """Klik 'Lainnya/More' di kartu baru dalam 1x execute_script, kembalikan jumlah klik"""
+    return driver.execute_script(
+        EXPAND_MORE_JS, container,
+        REVIEW_CARD_SELECTOR, REVIEW_CARD_FALLBACK_SELECTOR, MORE_BUTTON_LABELS,
+    ) or 0
+
+
+# Endpoint RPC yang dipakai feed ulasan Maps untuk paginasi
+REVIEW_RPC_MARKERS = [
+    "/maps/rpc/listugcposts",
+    "/maps/preview/review/listentitiesreviews",
+]
+
+# Posisi field di payload (array bersarang, bisa berubah kalau Maps update).
+# listugcposts: data[2] = daftar ulasan, tiap entri r[0] = ulasan
+UGC_REVIEW_PATHS = {
+    "id": [0, 0],
+    "name": [0, 1, 4, 5, 0],
+    "date": [0, 1, 6],
+    "timestamp": [0, 1, 2],  # mikrodetik epoch
+    "rating": [0, 2, 0, 0],
+    "text": [0, 2, 15, 0, 0],
+}
+
+# listentitiesreviews (format lama): data[2] = daftar ulasan
+LEGACY_REVIEW_PATHS = {
+    "id": [10],
+    "name": [0, 1],
+    "date": [1],
+    "timestamp": [27],  # milidetik epoch
+    "rating": [4],
+    "text": [3],
+}
+
+
+def _dig(obj, path):
+    """Ambil nilai dari array bersarang, None bila path tidak ada."""
+    for key in path:
+        try:
+            obj = obj[key]
+        except (IndexError, KeyError, TypeError):
+            return None
+    return obj
+
+
+def _dig_text(obj, path):
+    v = _dig(obj, path)
+    return v.strip() if isinstance(v, str) else ""
+
+
+def load_rpc_payload(body):
+    """Parse body respons RPC Maps (diawali prefix anti-XSSI), None bila gagal."""
+    if body.startswith(")]}'"):
+        body = body[4:]
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def extract_page_token(payload):
+    """Token halaman berikutnya dari payload listugcposts, None bila habis."""
+    token = _dig(payload, [1])
+    return token if isinstance(token, str) and token else None
+
+
+def decode_review_payload(payload):
+    """Ubah payload RPC ulasan menjadi daftar kartu (format sama dengan jalur DOM)."""
+    entries = _dig(payload, [2])
+    if not isinstance(entries, list):
+        return []
+
+    cards = []
+    for r in entries:
+        if isinstance(_dig(r, [0]), list):
+            paths, ts_divisor = UGC_REVIEW_PATHS, 1_000_000
+        else:
+            paths, ts_divisor = LEGACY_REVIEW_PATHS, 1_000
+
+        rid = _dig(r, paths["id"])
+        if not isinstance(rid, str) or not rid:
+            continue
+
+        rating = _dig(r, paths["rating"])
+        ts = _dig(r, paths["timestamp"])
+        timestamp = ""
+        if isinstance(ts, (int, float)) and ts > 0:
+            timestamp = datetime.fromtimestamp(ts / ts_divisor).isoformat(timespec="seconds")
+
+        cards.append({
+            "id": rid,
+            "signature": rid,
+            "name": _dig_text(r, paths["name"]),
+            "rating_aria": str(rating) if isinstance(rating, (int, float)) else "",
+            "date": _dig_text(r, paths["date"]),
+            "text": _dig_text(r, paths["text"]),
+            "extra": {"review_id": rid, "timestamp": timestamp},
+        })
+    return cards
+
+
+class NetworkUsage:
+    """Byte yang benar-benar diterima dan request yang diblokir, per tab.
+
+    Dihitung dari event performance log: `Network.loadingFinished`
+    (encodedDataLength) dan `Network.loadingFailed` dengan blockedReason.
+    Berbeda dengan Resource Timing, respons lintas origin tanpa
+    Timing-Allow-Origin (foto, avatar, font) ikut terhitung.
+    """
+
+    def __init__(self):
+        self.tabs = {}  # webview (target id tab) -> [byte diterima, request diblokir]
+
+    def record(self, webview, method, params):
+        if method == "Network.loadingFinished":
+            self.tabs.setdefault(webview, [0, 0])[0] += params.get("encodedDataLength") or 0
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            self.tabs.setdefault(webview, [0, 0])[1] += 1
+
+    def totals(self, handle=None):
+        """(byte diterima, request diblokir); `handle` membatasi ke satu tab."""
+        rows = [v for k, v in self.tabs.items()
+                if handle is None or (k and k.lower() in handle.lower())]
+        return sum(r[0] for r in rows), sum(r[1] for r in rows)
+
+
+def read_network_events(driver, usage=None):
+    """Kosongkan performance log; kembalikan [(method, params)] dan catat pemakaian ke `usage`."""
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return []
+    events = []
+    for entry in entries:
         try:
-            btns = container.find_elements(By.XPATH, xp)
-            for b in btns:
+            outer = json.loads(entry["message"])
+            message = outer["message"]
+        except (KeyError, ValueError):
+            continue
+        method = message.get("method")
+        params = message.get("params", {})
+        if usage is not None:
+            usage.record(outer.get("webview", ""), method, params)
+        events.append((method, params))
+    return events
+
+
+def network_usage(driver, usage, handle=None):
+    """Baca sisa log lalu kembalikan (byte diterima, request diblokir)."""
+    read_network_events(driver, usage)
+    return usage.totals(handle)
+
+
+class NetworkReviewCapture:
+    """Tangkap respons paginasi ulasan dari performance log (CDP Network)."""
+
+    def __init__(self, markers=None, usage=None):
+        self.markers = markers or REVIEW_RPC_MARKERS
+        self.usage = usage  # NetworkUsage: log yang dibaca di sini ikut dihitung
+        self.pending = {}
+        self.responses = 0
+        self.pages = []  # (url request, token halaman berikutnya)
+
+    def _is_review_rpc(self, url):
+        return any(m in url for m in self.markers)
+
+    def discard(self, driver):
+        """Buang event yang sudah ada di log tanpa mengambil body (mis. RPC urutan 'Paling relevan')."""
+        read_network_events(driver, self.usage)
+        self.pending.clear()
+
+    def collect(self, driver):
+        """Baca event jaringan terbaru, kembalikan kartu dari respons yang sudah selesai."""
+        cards = []
+        for method, params in read_network_events(driver, self.usage):
+            if method == "Network.responseReceived":
+                url = params.get("response", {}).get("url", "")
+                if self._is_review_rpc(url):
+                    self.pending[params["requestId"]] = url
+
+            elif method == "Network.loadingFinished" and params.get("requestId") in self.pending:
+                request_id = params["requestId"]
+                url = self.pending.pop(request_id)
                 try:
-                    b.click()
-                    time.sleep(0.05)
+                    resp = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
                 except Exception:
-                    pass
-        except Exception:
-            pass
+                    continue
+                body = resp.get("body", "")
+                if resp.get("base64Encoded"):
+                    body = base64.b64decode(body).decode("utf-8", errors="replace")
+                self.responses += 1
+                payload = load_rpc_payload(body)
+                self.pages.append((url, extract_page_token(payload)))
+                cards.extend(decode_review_payload(payload))
+        return cards
+
+
+def make_url_template(url, token):
+    """Ganti token di URL request dengan placeholder, None bila token tidak ada di URL."""
+    if not url or not token:
+        return None
+    quoted = quote(token, safe="")
+    if quoted in url:
+        return url.replace(quoted, "{token}")
+    if token in url:
+        return url.replace(token, "{raw_token}")
+    return None
+
+
+class ReviewFeedFetcher:
+    """Klien HTTP tanpa browser untuk paginasi feed ulasan (koneksi keep-alive)."""
+
+    def __init__(self, url_template, cookies=None, headers=None, timeout=20, pool_size=2):
+        self.url_template = url_template
+        self.headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+            **(headers or {}),
+        }
+        if cookies:
+            self.headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in cookies.items())
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._pool = {}
+        self.requests = 0
+        self.bytes_received = 0
+
+    def _acquire(self, key):
+        idle = self._pool.setdefault(key, [])
+        if idle:
+            return idle.pop()
+        scheme, netloc = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _release(self, key, conn):
+        idle = self._pool.setdefault(key, [])
+        if len(idle) < self.pool_size:
+            idle.append(conn)
+        else:
+            conn.close()
+
+    def get(self, url):
+        """GET lewat koneksi dari pool; coba ulang 1x bila koneksi lama sudah ditutup server."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+
+        for attempt in range(2):
+            conn = self._acquire(key)
+            try:
+                conn.request("GET", path, headers=self.headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+
+            self.requests += 1
+            self.bytes_received += len(body)
+            if resp.status != 200:
+                raise RuntimeError(f"HTTP {resp.status} untuk {url}")
+            return body.decode("utf-8", errors="replace")
+
+    def fetch_page(self, token):
+        """Ambil 1 halaman, kembalikan (kartu, token berikutnya)."""
+        url = (self.url_template
+               .replace("{token}", quote(token, safe=""))
+               .replace("{raw_token}", token))
+        payload = load_rpc_payload(self.get(url))
+        if payload is None:
+            return [], None
+        return decode_review_payload(payload), extract_page_token(payload)
+
+    def iter_pages(self, first_token, max_pages=None):
+        token = first_token
+        pages = 0
+        while token and (max_pages is None or pages < max_pages):
+            cards, token = self.fetch_page(token)
+            pages += 1
+            yield cards
+
+    def close(self):
+        for idle in self._pool.values():
+            for conn in idle:
+                conn.close()
+        self._pool.clear()
+
+
+def bootstrap_review_fetcher(driver, capture):
+    """Bangun fetcher dari cookie Chrome dan request RPC yang sudah tertangkap.
+
+    Butuh minimal 2 halaman tertangkap: URL halaman ke-2 memuat token dari
+    halaman pertama, sehingga posisi token di URL bisa dijadikan template.
+    Mengembalikan (fetcher, token berikutnya) atau (None, None).
+    """
+    tokens = [token for _, token in capture.pages if token]
+    for url, _ in capture.pages:
+        for token in tokens:
+            template = make_url_template(url, token)
+            if template:
+                cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
+                next_token = capture.pages[-1][1]
+                if not next_token:
+                    return None, None
+                return ReviewFeedFetcher(template, cookies=cookies), next_token
+    return None, None
+
+
+class ReviewFilter:
+    """Aturan per kartu yang sama untuk jalur DOM, multi-tab dan HTTP.
+
+    check() mengembalikan (record, None) bila ulasan diterima, atau
+    (None, alasan) dengan alasan "seen", "known", "incomplete" atau "old".
+    Penghitung (diskip, ulasan lama/tersimpan berturut-turut, id terakhir)
+    diperbarui di sini, jadi ketiga jalur tidak bisa berbeda aturan.
+    """
+
+    def __init__(self, years_back=5, known=None, known_run_to_stop=10):
+        self.years_back = years_back
+        self.known = known or set()
+        self.known_run_to_stop = known_run_to_stop
+        self.seen = set()
+        self.skipped_count = 0
+        self.skipped_old_date = 0
+        self.found_old_reviews_count = 0
+        self.known_streak = 0
+        self.last_review_id = ""
+        self.last_new_card = time.time()  # Kartu baru terakhir (termasuk yang diskip)
+
+    def check(self, card, captured_at):
+        signature = card["signature"] if card else None
+        if not signature or signature in self.seen:
+            return None, "seen"
+        self.seen.add(signature)
+        self.last_review_id = card["id"] or self.last_review_id
+        self.last_new_card = time.time()
+
+        name, date, text = card["name"], card["date"], card["text"]
+        if self.known and (card["id"] in self.known or review_key(name, text) in self.known):
+            self.known_streak += 1
+            return None, "known"
+        self.known_streak = 0
+
+        if not name or not date or not text:
+            self.skipped_count += 1
+            return None, "incomplete"
+
+        if not is_within_last_n_years(date, self.years_back):
+            self.skipped_old_date += 1
+            self.found_old_reviews_count += 1
+            return None, "old"
+        self.found_old_reviews_count = 0
+
+        extra = card.get("extra", {})
+        return {
+            "name": name,
+            "rating": parse_rating_from_aria(card["rating_aria"]),
+            "date": date,
+            "text": text,
+            "review_id": card["id"],
+            **review_time_fields(date, captured_at, extra.get("timestamp")),
+            **extra,
+        }, None
+
+    def reached_known(self):
+        """Refresh: sudah `known_run_to_stop` ulasan tersimpan berturut-turut."""
+        return bool(self.known) and self.known_streak >= self.known_run_to_stop
+
+
+def fetch_reviews_http(fetcher, first_token, data, review_filter=None, max_reviews=None,
+                       max_old_reviews_before_stop=30, max_pages=None):
+    """Lanjutkan paginasi tanpa browser; record ditambahkan ke `data` (format sama dengan DOM).
+
+    `review_filter` (ReviewFilter) dipakai bersama jalur DOM: kartu yang sudah
+    dilihat dilewati dan mode refresh berhenti di ulasan yang sudah tersimpan.
+    Mengembalikan review_filter.
+    """
+    review_filter = review_filter or ReviewFilter()
+
+    for cards in fetcher.iter_pages(first_token, max_pages=max_pages):
+        captured_at = datetime.now()
+        for card in cards:
+            record, reason = review_filter.check(card, captured_at)
+            if reason == "known" and review_filter.reached_known():
+                break
+            if not record:
+                continue
+            data.append(record)
+            if max_reviews and len(data) >= max_reviews:
+                return review_filter
+
+        if isinstance(data, ReviewCollector):
+            data.flush()
+        print(f" HTTP halaman #{fetcher.requests} | Data: {len(data)} | Diskip: {review_filter.skipped_count} | Lama: {review_filter.found_old_reviews_count}/{max_old_reviews_before_stop}")
+        if review_filter.found_old_reviews_count >= max_old_reviews_before_stop:
+            break
+        if review_filter.reached_known():
+            print(f"✓ Sampai di ulasan yang sudah tersimpan ({review_filter.known_streak}x berturut-turut)")
+            break
+
+    return review_filter
+
+
+class PacingController:
+    """Atur ukuran batch scroll dan batas tunggu berdasarkan hasil tiap pass.
+
+    Naik (batch lebih besar, tunggu lebih singkat) selama feed terus
+    mengirim kartu; mundur (batch kecil, tunggu lebih lama) saat scroll
+    tidak memunculkan apa pun, yang biasanya berarti Maps sedang membatasi.
+    """
+
+    def __init__(self, batch_size=3, timeout=2.0, min_batch=1, max_batch=8,
+                 min_timeout=0.5, max_timeout=8.0):
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.last_action = "awal"
+        self.scrolls = 0
+        self.arrivals = 0
+
+    def record_scroll(self, scrolls, arrivals):
+        """Catat jumlah scroll dan berapa yang memunculkan kartu baru."""
+        self.scrolls += scrolls
+        self.arrivals += arrivals
+
+    def record_pass(self, new_cards):
+        """Evaluasi 1 parse pass lalu sesuaikan batch dan batas tunggu."""
+        rate = self.arrivals / self.scrolls if self.scrolls else 0.0
+
+        if self.arrivals == 0 or new_cards == 0:
+            self.batch_size = max(self.min_batch, self.batch_size // 2)
+            self.timeout = min(self.max_timeout, self.timeout * 1.5)
+            self.last_action = "mundur"
+        elif rate >= 0.8:
+            self.batch_size = min(self.max_batch, self.batch_size + 1)
+            self.timeout = max(self.min_timeout, self.timeout * 0.8)
+            self.last_action = "naik"
+        else:
+            self.last_action = "tahan"
+
+        self.scrolls = 0
+        self.arrivals = 0
+
+    def status(self):
+        return f"Batch: {self.batch_size} | Tunggu: {self.timeout:.1f}s ({self.last_action})"
 
 
 def parse_rating_from_aria(aria_label):
@@ -297,16 +1735,161 @@ def parse_rating_from_aria(aria_label):
     return m.group(1).replace(",", ".")
 
 
-def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, newest_first=True, 
-                   scroll_pause=0.3, login_time=60, years_back=5):
-    global TEMP_DATA, DRIVER_INSTANCE
-    
+# Chromedriver yang ikut repo dan cache hasil resolve per versi mayor Chrome
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+DRIVER_CACHE_FILE = os.path.join(BASE_PATH, "chromedriver_cache.json")
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+_RESOLVED_DRIVER = None  # Per proses: deteksi versi cukup sekali
+
+
+def _major_version(text):
+    match = re.search(r"(\d+)\.\d+\.\d+\.\d+", text or "")
+    return match.group(1) if match else None
+
+
+def detect_chrome_version():
+    """Versi mayor Chrome terpasang (registry di Windows, --version di Linux/macOS), tanpa jaringan."""
+    if os.name == "nt":
+        import winreg
+        for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                with winreg.OpenKey(root, r"Software\Google\Chrome\BLBeacon") as key:
+                    return _major_version(winreg.QueryValueEx(key, "version")[0])
+            except OSError:
+                continue
+        return None
+    for binary in CHROME_BINARIES:
+        try:
+            out = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        version = _major_version(out)
+        if version:
+            return version
+    return None
+
+
+def chromedriver_version(path):
+    try:
+        out = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return _major_version(out)
+
+
+def read_driver_cache():
+    """Isi cache {versi Chrome: path chromedriver}; cache rusak/hilang dianggap kosong."""
+    try:
+        with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            drivers = json.load(f).get("drivers", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+    return drivers if isinstance(drivers, dict) else {}
+
+
+def write_driver_cache(drivers):
+    """Tulis cache secara atomik; file sementara per proses supaya worker paralel tidak bentrok."""
+    tmp_path = f"{DRIVER_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"drivers": drivers}, f, ensure_ascii=False)
+        os.replace(tmp_path, DRIVER_CACHE_FILE)
+    except OSError as e:
+        print(f"  Cache chromedriver tidak tersimpan: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def resolve_chromedriver(chromedriver_path=None):
+    """Cari chromedriver tanpa jaringan bila memungkinkan.
+
+    Urutan: `chromedriver_path` eksplisit, cache per versi Chrome (dipakai
+    hanya bila `--version` driver-nya masih cocok), lalu ChromeDriverManager
+    dan hasilnya di-cache. Bila versi Chrome tidak terdeteksi, cache dilewati.
+    """
+    global _RESOLVED_DRIVER
+
+    if chromedriver_path:
+        if not os.path.exists(chromedriver_path):
+            raise RuntimeError(f"Chromedriver tidak ditemukan: {chromedriver_path}")
+        return chromedriver_path
+    if _RESOLVED_DRIVER:
+        return _RESOLVED_DRIVER
+
+    chrome_version = detect_chrome_version()
+    if not chrome_version:
+        # Tanpa versi, cocok-tidaknya driver tidak bisa dicek: serahkan ke ChromeDriverManager
+        _RESOLVED_DRIVER = ChromeDriverManager().install()
+        return _RESOLVED_DRIVER
+
+    drivers = read_driver_cache()
+    path = drivers.get(chrome_version)
+    if not (path and os.path.exists(path) and chromedriver_version(path) == chrome_version):
+        print(f" Mengunduh chromedriver untuk Chrome {chrome_version} (sekali saja)...")
+        path = ChromeDriverManager().install()
+        # Baca ulang sebelum menulis supaya entri dari worker lain tidak tertimpa
+        drivers = {**read_driver_cache(), chrome_version: path}
+        write_driver_cache(drivers)
+
+    _RESOLVED_DRIVER = path
+    return path
+
+
+# Resource yang tidak pernah dibaca scraper: tile peta, foto, font, media.
+# RPC ulasan (/maps/rpc/...) dan script/CSS tetap dimuat.
+BLOCKED_URL_PATTERNS = [
+    "*/maps/vt*", "*/kh/v*", "*/maps/preview/photo*", "*/maps/photometa*",
+    "*googleusercontent.com/*", "*ggpht.com/*", "*fonts.gstatic.com/*", "*fonts.googleapis.com/*",
+    "*streetviewpixels*", "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.mp4*", "*.webm*", "*.mp3*",
+]
+
+# Profil "server": headless, viewport sebatas panel ulasan, tanpa GPU dan
+# layanan latar Chrome, renderer digabung (bukan satu proses per situs)
+SERVER_WINDOW_SIZE = (640, 900)
+SERVER_CHROME_ARGS = [
+    "--headless=new",
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--hide-scrollbars",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-site-isolation-trials",
+    "--disable-features=site-per-process,IsolateOrigins,Translate,MediaRouter,OptimizationHints",
+    "--renderer-process-limit=2",
+]
+
+
+def create_driver(chromedriver_path=None, headless=False, user_data_dir=None,
+                  capture_network=False, background_tabs=False, block_resources=False,
+                  server_profile=False, measure_network=True):
+    """Buat instance Chrome dengan opsi anti-deteksi yang sama untuk semua mode.
+
+    `server_profile` memakai SERVER_CHROME_ARGS (selalu headless) untuk
+    worker tanpa layar, menggantikan jendela maksimal. `measure_network`
+    menyalakan performance log untuk NetworkUsage (byte/request diblokir).
+    """
     opts = Options()
     
-    opts.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36")
+    opts.add_argument(f"user-agent={USER_AGENT}")
     opts.add_argument("--lang=id-ID")
     opts.add_argument("--disable-notifications")
-    opts.add_argument("--start-maximized")
+    if server_profile:
+        opts.add_argument("--window-size={},{}".format(*SERVER_WINDOW_SIZE))
+        for arg in SERVER_CHROME_ARGS:
+            opts.add_argument(arg)
+    else:
+        opts.add_argument("--start-maximized")
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
     opts.add_argument("--disable-blink-features=AutomationControlled")
@@ -318,16 +1901,41 @@ def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, new
         "credentials_enable_service": False,
         "profile.password_manager_enabled": False
     }
+    if block_resources:
+        prefs["profile.managed_default_content_settings.images"] = 2
+        opts.add_argument("--blink-settings=imagesEnabled=false")
     opts.add_experimental_option("prefs", prefs)
     
-    if headless:
+    if headless and not server_profile:
         opts.add_argument("--headless=new")
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
-    DRIVER_INSTANCE = driver
+    if background_tabs and not server_profile:
+        # Tab di belakang tetap memuat ulasan saat tab lain sedang diproses
+        opts.add_argument("--disable-background-timer-throttling")
+        opts.add_argument("--disable-backgrounding-occluded-windows")
+        opts.add_argument("--disable-renderer-backgrounding")
+
+    if user_data_dir:
+        # Profil Chrome sendiri (wajib bila beberapa Chrome jalan paralel)
+        opts.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
+
+    if capture_network or measure_network:
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    driver = webdriver.Chrome(service=Service(resolve_chromedriver(chromedriver_path)), options=opts)
+    setup_tab(driver, capture_network or measure_network, block_resources)
+    return driver
+
+
+def setup_tab(driver, capture_network=False, block_resources=False):
+    """Override CDP berlaku per tab, jadi dipasang ulang di setiap tab baru."""
+    if capture_network or block_resources:
+        driver.execute_cdp_cmd("Network.enable", {})
+    if block_resources:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     
     driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-        "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36'
+        "userAgent": USER_AGENT
     })
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
@@ -338,14 +1946,88 @@ def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, new
             Object.defineProperty(navigator, 'languages', {get: () => ['id-ID', 'id', 'en-US', 'en']});
         '''
     })
+
+
+def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, newest_first=True, 
+                   scroll_pause=0.3, login_time=60, years_back=5, batch_extract=True,
+                   prune_harvested=False, new_cards_timeout=2.0, adaptive_pacing=False,
+                   capture_network=False, http_fetcher=False, stream_file=None,
+                   checkpoint_file=None, resume=False, checkpoint_interval=30,
+                   user_data_dir=None, block_resources=False, server_profile=False,
+                   incremental=False, known_run_to_stop=10):
+    global TEMP_DATA, DRIVER_INSTANCE
     
-    wait = WebDriverWait(driver, 20)
+    # Fetcher HTTP butuh request RPC yang tertangkap untuk bootstrap
+    capture_network = capture_network or http_fetcher
+    driver = create_driver(chromedriver_path, headless=headless, user_data_dir=user_data_dir,
+                           capture_network=capture_network, block_resources=block_resources,
+                           server_profile=server_profile)
+    DRIVER_INSTANCE = driver
+
+    usage = NetworkUsage()
+    capture = NetworkReviewCapture(usage=usage) if capture_network else None
 
-    data = []
-    seen = set()
-    skipped_count = 0
-    skipped_old_date = 0
-    found_old_reviews_count = 0
+    wait = WebDriverWait(driver, 20)
+    driver.set_script_timeout(max(30, new_cards_timeout + 10))
+
+    # Refresh: ulasan baru ke file sementara, berhenti di ulasan yang sudah tersimpan
+    known = set()
+    if incremental:
+        if not (stream_file and os.path.exists(stream_file)):
+            print("  Refresh butuh file tempat yang sudah ada, scrape penuh")
+            incremental = False
+        elif not newest_first:
+            print("  Refresh butuh urutan 'Terbaru', scrape penuh")
+            incremental = False
+        else:
+            known = load_known_reviews(stream_file)
+            print(f"✓ Refresh: {len(known)} kunci ulasan lama dari {stream_file}")
+            checkpoint_file = None  # Run refresh pendek, tidak perlu resume
+            resume = False
+    output_file = refresh_path(stream_file) if incremental else stream_file
+
+    checkpoint = load_checkpoint(checkpoint_file) if resume else None
+    if resume and not checkpoint:
+        print("  Checkpoint tidak ditemukan, mulai dari awal")
+    if checkpoint and not stream_file:
+        print("  Resume butuh stream_file (data lama ada di file), mulai dari awal")
+        checkpoint = None
+
+    SELECTOR_REGISTRY.load(SELECTOR_STATS_FILE)  # Urutan selector dari run sebelumnya
+
+    # Dengan stream_file, record langsung ditulis ke disk per batch
+    data = ReviewCollector(StreamingReviewSink(output_file, append=bool(checkpoint)) if output_file else None)
+    TEMP_DATA = data  # Referensi yang sama untuk auto-save saat interupsi
+    review_filter = ReviewFilter(years_back, known=known, known_run_to_stop=known_run_to_stop)
+    seen = review_filter.seen
+    feed_state = {"scroll_top": 0, "card_count": 0}
+    completed = False
+
+    if checkpoint:
+        # Checkpoint bisa tertinggal sampai checkpoint_interval dari file (proses
+        # mati mendadak), jadi jumlah dan posisi terakhir diambil dari file itu sendiri
+        count, written_ids, last_written_id = load_stream_state(data.sink.partial_path)
+        seen.update(checkpoint.get("seen", []))
+        seen.update(written_ids)
+        data.count = count
+        review_filter.skipped_count = checkpoint.get("skipped_count", 0)
+        review_filter.skipped_old_date = checkpoint.get("skipped_old_date", 0)
+        review_filter.last_review_id = last_written_id or checkpoint.get("last_review_id", "")
+        checkpoint["last_review_id"] = review_filter.last_review_id  # Catch-up ke ulasan terakhir yang tertulis
+        feed_state = {k: checkpoint.get(k, 0) for k in feed_state}
+        print(f"✓ Resume: {data.count} ulasan, {len(seen)} kartu sudah diproses")
+
+    def write_checkpoint():
+        if checkpoint_file:
+            save_checkpoint(checkpoint_file, {
+                "url": url,
+                "count": len(data),
+                "seen": list(seen),
+                "last_review_id": review_filter.last_review_id,
+                "skipped_count": review_filter.skipped_count,
+                "skipped_old_date": review_filter.skipped_old_date,
+                **feed_state,
+            })
 
     try:
         driver.get(url)
@@ -354,21 +2036,31 @@ def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, new
 
         try_handle_consent(driver)
 
-        # HANYA login manual, TANPA scroll manual
-        wait_for_manual_login(driver, login_time)
+        # Login manual hanya bila profil (user_data_dir) belum login
+        ensure_logged_in(driver, login_time, headless=headless or server_profile)
 
         feed = open_reviews_panel(driver, wait)
 
         if newest_first:
-            sort_reviews_newest(driver)
+            sort_reviews_newest(driver, capture)
+
+        if checkpoint:
+            catch_up_to_checkpoint(driver, feed, checkpoint, timeout=new_cards_timeout)
 
-        last_count = 0
+        if prune_harvested:
+            prune_harvested_cards(driver, feed)  # Aktifkan pelacakan kartu
+
+        last_count = len(data)
+        last_checkpoint = time.time()
         scroll_attempts = 0
+        pruned_count = 0
         consecutive_no_new_data = 0
         max_consecutive_no_new_data = 30
         max_old_reviews_before_stop = 30
         scroll_batch_size = 3  # Scroll 3x sebelum parsing data
         parse_every_n_scrolls = 2  # Parse data setiap 2 batch scroll
+        batch_count = 0
+        pacer = PacingController(scroll_batch_size, new_cards_timeout) if adaptive_pacing else None
 
         print("\n" + "="*60)
         print(f"MEMULAI SCRAPING OTOMATIS - {years_back} TAHUN TERAKHIR")
@@ -381,88 +2073,97 @@ def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, new
         print("  Tekan Ctrl+C untuk stop dan auto-save")
         print("="*60 + "\n")
 
-        while found_old_reviews_count < max_old_reviews_before_stop:
+        while review_filter.found_old_reviews_count < max_old_reviews_before_stop:
             # Scroll batch dulu (3x scroll sekaligus)
-            for _ in range(scroll_batch_size):
-                fast_scroll(driver, feed, times=2)  # 2x scroll per call = 6x total
+            batch_size = pacer.batch_size if pacer else scroll_batch_size
+            timeout = pacer.timeout if pacer else new_cards_timeout
+            for _ in range(batch_size):
+                attempted, arrived = fast_scroll(driver, feed, times=2, timeout=timeout)  # 2x scroll per call = 6x total
                 scroll_attempts += 1
+                if pacer:
+                    pacer.record_scroll(attempted, arrived)
+                if not arrived:
+                    break  # Feed belum memuat apa pun, tidak perlu scroll lagi
+            batch_count += 1
             
-            # Expand buttons setelah scroll batch
-            expand_more_buttons(driver, feed)
+            # Expand buttons setelah scroll batch (mode jaringan: teks penuh ada di payload)
+            if not capture:
+                expand_more_buttons(driver, feed)
             
             # Parse data setiap 2 batch scroll (atau setiap ~50 data baru)
-            if scroll_attempts % parse_every_n_scrolls != 0:
+            if batch_count % parse_every_n_scrolls != 0:
                 continue
 
-            items = feed.find_elements(By.CSS_SELECTOR, "div[data-review-id]")
-            if not items:
-                items = feed.find_elements(By.CSS_SELECTOR, "div[role='article']")
+            if capture:
+                # DOM hanya untuk scroll, data diambil dari respons RPC
+                cards = capture.collect(driver)
+            elif batch_extract:
+                # 1 round trip untuk semua kartu baru
+                cards = extract_reviews_batch(driver, feed)
+            else:
+                # Hanya kartu baru sejak kursor terakhir, bukan seluruh feed
+                items = collect_new_cards(driver, feed)
+                cards = (read_review_card(it, seen) for it in items)
 
             current_iteration_count = 0
+            new_card_count = 0
+            captured_at = datetime.now()  # Jangkar tanggal relatif untuk batch ini
             
-            for it in items:
-                rid = it.get_attribute("data-review-id") or ""
-                signature = rid or (it.text[:120].strip())
-                if not signature or signature in seen:
-                    continue
-
-                name = safe_text(it, [
-                    "div.d4r55", "span.d4r55",
-                    "a[href*='maps/contrib']",
-                ])
-
-                rating_aria = safe_attr(it, [
-                    "span.kvMYJc",
-                    "span[role='img']",
-                    "span[aria-label*='bintang']",
-                    "span[aria-label*='stars']",
-                ], "aria-label")
-                rating = parse_rating_from_aria(rating_aria)
-
-                date = safe_text(it, [
-                    "span.rsqaWe",
-                ])
-
-                text = safe_text(it, [
-                    "span.wiI7pd",
-                    "div.MyEned",
-                    "span.MyEned",
-                ])
-
-                seen.add(signature)
-
-                if not name or not date or not text:
-                    skipped_count += 1
-                    continue
-
-                if not is_within_last_n_years(date, years_back):
-                    skipped_old_date += 1
-                    found_old_reviews_count += 1
+            for card in cards:
+                record, reason = review_filter.check(card, captured_at)
+                if reason != "seen":
+                    new_card_count += 1
+                if reason == "known" and review_filter.reached_known():
+                    break
+                if not record:
                     continue
-                else:
-                    found_old_reviews_count = 0
-
-                review_data = {
-                    "name": name,
-                    "rating": rating,
-                    "date": date,
-                    "text": text,
-                }
-                data.append(review_data)
-                TEMP_DATA = data.copy()  # Update global untuk auto-save
+                data.append(record)  # Langsung terlihat oleh auto-save
                 current_iteration_count += 1
 
                 if max_reviews and len(data) >= max_reviews:
                     break
 
+            data.flush()  # Batch ini langsung ke disk (mode streaming)
+            if not capture:
+                read_network_events(driver, usage)  # Log tidak menumpuk di chromedriver
+
+            if checkpoint_file and time.time() - last_checkpoint >= checkpoint_interval:
+                feed_state = driver.execute_script(FEED_STATE_JS, feed, REVIEW_CARD_SELECTOR)
+                write_checkpoint()
+                last_checkpoint = time.time()
+
+            if prune_harvested:
+                pruned_count += prune_harvested_cards(driver, feed)
+
             if max_reviews and len(data) >= max_reviews:
                 print(f"\n Target {max_reviews} ulasan tercapai!")
                 break
 
-            if found_old_reviews_count >= max_old_reviews_before_stop:
-                print(f"\n Mencapai batas {years_back} tahun ({found_old_reviews_count} ulasan lama)")
+            if review_filter.found_old_reviews_count >= max_old_reviews_before_stop:
+                print(f"\n Mencapai batas {years_back} tahun ({review_filter.found_old_reviews_count} ulasan lama)")
                 break
 
+            if review_filter.reached_known():
+                print(f"\n✓ Sampai di ulasan yang sudah tersimpan ({review_filter.known_streak}x berturut-turut)")
+                break
+
+            if http_fetcher:
+                fetcher, next_token = bootstrap_review_fetcher(driver, capture)
+                if fetcher:
+                    print("\n✓ Template paginasi ditemukan, lanjut tanpa browser (HTTP)...")
+                    data.page_bytes, data.blocked_requests = network_usage(driver, usage)  # Sebelum browser ditutup
+                    driver.quit()  # Chrome hanya untuk cookie dan token pertama
+                    try:
+                        fetch_reviews_http(
+                            fetcher, next_token, data, review_filter,
+                            max_reviews=max_reviews,
+                            max_old_reviews_before_stop=max_old_reviews_before_stop,
+                        )
+                    finally:
+                        fetcher.close()
+                    print(f"✓ HTTP: {fetcher.requests} request, {fetcher.bytes_received / 1024:.0f} KB")
+                    break
+
             # Check data baru
             if len(data) == last_count:
                 consecutive_no_new_data += 1
@@ -474,18 +2175,34 @@ def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, new
                 print(f"\n✓ Tidak ada data baru setelah {consecutive_no_new_data}x scroll")
                 break
             
+            pacing_info = ""
+            if pacer:
+                pacer.record_pass(new_card_count)
+                pacing_info = f" | {pacer.status()}"
+
             # Progress update setiap parse (lebih sering)
-            print(f" Scroll #{scroll_attempts} | Data: {len(data)} (+{current_iteration_count} baru) | Diskip: {skipped_count} | Lama: {found_old_reviews_count}/{max_old_reviews_before_stop}")
+            print(f" Scroll #{scroll_attempts} | Data: {len(data)} (+{current_iteration_count} baru) | Diskip: {review_filter.skipped_count} | Lama: {review_filter.found_old_reviews_count}/{max_old_reviews_before_stop}{pacing_info}")
+
+        if data.page_bytes is None:
+            data.page_bytes, data.blocked_requests = network_usage(driver, usage)
 
         print("\n" + "="*60)
         print("SCRAPING SELESAI")
         print("="*60)
         print(f"Total ulasan ({years_back} tahun): {len(data)}")
-        print(f"Diskip (incomplete): {skipped_count}")
-        print(f"Diskip (>{years_back}thn): {skipped_old_date}")
+        print(f"Diskip (incomplete): {review_filter.skipped_count}")
+        print(f"Diskip (>{years_back}thn): {review_filter.skipped_old_date}")
         print(f"Total scroll: {scroll_attempts}")
+        if data.page_bytes is not None:
+            print(f"Data diterima: {data.page_bytes / 1024:.0f} KB | Request diblokir: {data.blocked_requests}")
+        if prune_harvested:
+            print(f"Kartu dikosongkan: {pruned_count}")
+        if capture:
+            print(f"Respons RPC ulasan: {capture.responses}")
+        SELECTOR_REGISTRY.report()
         print("="*60 + "\n")
 
+        completed = True
         return data
 
     except KeyboardInterrupt:
@@ -498,6 +2215,254 @@ def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, new
         return data
     
     finally:
+        data.close()
+        SELECTOR_REGISTRY.save_safely(SELECTOR_STATS_FILE)
+        if incremental:
+            # Juga saat terhenti: ulasan baru yang sudah tertulis tetap valid
+            added = merge_refreshed_reviews(output_file, stream_file)
+            print(f"✓ Refresh: {added} ulasan baru ditambahkan ke {stream_file}")
+        if checkpoint_file:
+            if completed:
+                # Selesai normal: checkpoint tidak diperlukan lagi
+                if os.path.exists(checkpoint_file):
+                    os.remove(checkpoint_file)
+            else:
+                write_checkpoint()  # Posisi scroll dari checkpoint berkala terakhir
+        print("\nMenutup browser...")
+        try:
+            driver.quit()
+            DRIVER_INSTANCE = None
+        except:
+            pass
+
+
+CARD_SELECTORS = f"{REVIEW_CARD_SELECTOR}, {REVIEW_CARD_FALLBACK_SELECTOR}"
+
+# Scroll tanpa menunggu; MutationObserver menandai feed.__arrived begitu kartu
+# baru masuk, supaya tab lain bisa dicek murah (ARRIVED_JS) tanpa scroll ulang.
+SCROLL_AND_FLAG_JS = """
+const feed = arguments[0];
+const sel = arguments[1];
+if (!feed.__arrivalObserver) {
+    feed.__arrivalObserver = new MutationObserver((mutations) => {
+        for (const m of mutations) {
+            for (const n of m.addedNodes) {
+                if (n.nodeType === 1 && (n.matches(sel) || n.querySelector(sel))) {
+                    feed.__arrived = true;
+                    return;
+                }
+            }
+        }
+    });
+    feed.__arrivalObserver.observe(feed, {childList: true, subtree: true});
+}
+feed.__arrived = false;
+feed.scrollTop = feed.scrollHeight;
+"""
+
+ARRIVED_JS = "return !!arguments[0].__arrived;"
+
+
+def wait_for_any_tab(driver, tabs, timeout=2.0, poll_interval=0.1):
+    """Tunggu sampai salah satu tab menerima kartu baru; True bila ada sebelum timeout."""
+    end = time.time() + timeout
+    while time.time() < end:
+        for tab in tabs:
+            try:
+                driver.switch_to.window(tab.handle)
+                if driver.execute_script(ARRIVED_JS, tab.feed):
+                    return True
+            except Exception:
+                continue
+        time.sleep(poll_interval)
+    return False
+
+
+class ReviewTab:
+    """State scraping satu tempat yang dibuka di satu tab (handle, feed, data, filter)."""
+
+    def __init__(self, url, output_file, years_back=5):
+        self.url = url
+        self.output_file = output_file
+        self.handle = None
+        self.feed = None
+        self.data = ReviewCollector(StreamingReviewSink(output_file))
+        self.filter = ReviewFilter(years_back)
+        self.scrolls = 0
+        self.done_reason = None
+        self.started = time.time()
+        self.elapsed = 0.0
+
+    def accept(self, cards, max_reviews=None):
+        """Filter kartu dengan ReviewFilter tab ini; kembalikan jumlah ulasan yang ditambahkan."""
+        added = 0
+        captured_at = datetime.now()
+        for card in cards:
+            record, _ = self.filter.check(card, captured_at)
+            if not record:
+                continue
+            self.data.append(record)
+            added += 1
+            if max_reviews and len(self.data) >= max_reviews:
+                break
+        return added
+
+    def idle_seconds(self):
+        return time.time() - self.filter.last_new_card
+
+    def finish(self, reason):
+        self.done_reason = reason
+        self.elapsed = time.time() - self.started
+        self.data.close()
+
+
+def scrape_reviews_tabs(places, chromedriver_path=None, tabs=3, max_reviews=None, headless=False,
+                        newest_first=True, login_time=60, years_back=5, new_cards_timeout=2.0,
+                        user_data_dir=None, max_idle_seconds=30, max_old_reviews_before_stop=30,
+                        block_resources=False, server_profile=False):
+    """Scrape beberapa tempat dalam satu Chrome, masing-masing di tab sendiri.
+
+    `places` berisi pasangan (url, output_file). Tab diproses bergiliran:
+    selagi satu tab diekstrak, tab lain sedang memuat hasil scroll
+    sebelumnya, jadi waktu tunggu jaringan saling menutupi. Tab yang selesai
+    ditutup dan diganti tempat berikutnya. Setiap putaran berikutnya menunggu
+    sampai ada tab yang menerima kartu baru (maks. `new_cards_timeout`). Tab dianggap habis bila
+    tidak ada kartu baru selama `max_idle_seconds`. Mengembalikan list ReviewTab.
+    """
+    global TEMP_DATA, DRIVER_INSTANCE
+
+    pending = list(places)
+    active = []
+    finished = []
+    if not pending:
+        return finished
+
+    SELECTOR_REGISTRY.load(SELECTOR_STATS_FILE)
+    driver = create_driver(chromedriver_path, headless=headless, user_data_dir=user_data_dir,
+                           background_tabs=True, block_resources=block_resources,
+                           server_profile=server_profile)
+    DRIVER_INSTANCE = driver
+    wait = WebDriverWait(driver, 20)
+    driver.set_script_timeout(max(30, new_cards_timeout + 10))
+    usage = NetworkUsage()  # Log performance bersama semua tab, dipisah per target id
+
+    def close_tab(tab, reason):
+        try:
+            driver.switch_to.window(tab.handle)
+            tab.data.page_bytes, tab.data.blocked_requests = network_usage(driver, usage, tab.handle)
+            driver.close()
+        except Exception:
+            pass
+        tab.finish(reason)
+        if tab in active:
+            active.remove(tab)
+        finished.append(tab)
+        print(f"✓ Tab selesai ({reason}): {len(tab.data)} ulasan dalam {tab.elapsed:.0f} detik -> {tab.output_file}")
+
+    def open_next_tab():
+        while pending:
+            url, output_file = pending.pop(0)
+            tab = ReviewTab(url, output_file, years_back)
+            driver.switch_to.window(home)
+            driver.switch_to.new_window("tab")
+            tab.handle = driver.current_window_handle
+            try:
+                setup_tab(driver, capture_network=True, block_resources=block_resources)
+                driver.get(url)
+                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                tab.feed = open_reviews_panel(driver, wait)
+                if newest_first:
+                    sort_reviews_newest(driver)
+            except Exception as e:
+                print(f" Gagal membuka tab {url}: {e}")
+                close_tab(tab, "error")
+                continue
+            # Scroll pertama langsung dipicu, hasilnya diambil saat giliran tab ini
+            driver.execute_script(SCROLL_AND_FLAG_JS, tab.feed, CARD_SELECTORS)
+            tab.scrolls += 1
+            active.append(tab)
+            return tab
+        return None
+
+    try:
+        # Tab pertama hanya untuk consent/login, lalu jadi induk tab tempat
+        home = driver.current_window_handle
+        driver.get(pending[0][0])
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        time.sleep(1)
+        try_handle_consent(driver)
+        ensure_logged_in(driver, login_time, headless=headless or server_profile)
+        driver.get("about:blank")
+
+        for _ in range(tabs):
+            if not open_next_tab():
+                break
+
+        print("\n" + "="*60)
+        print(f"MEMULAI SCRAPING {len(active)} TAB - {years_back} TAHUN TERAKHIR")
+        print("="*60 + "\n")
+
+        while active:
+            for tab in list(active):
+                driver.switch_to.window(tab.handle)
+                TEMP_DATA = tab.data  # Auto-save saat interupsi mengikuti tab aktif
+                try:
+                    if len(active) == 1:
+                        # Tidak ada tab lain yang menutupi waktu muat, tunggu kartu baru
+                        attempted, _ = fast_scroll(driver, tab.feed, times=2, timeout=new_cards_timeout)
+                        tab.scrolls += attempted
+                    expand_more_buttons(driver, tab.feed)
+                    cards = extract_reviews_batch(driver, tab.feed)
+                    added = tab.accept(cards, max_reviews=max_reviews)
+                    tab.data.flush()
+                except Exception as e:
+                    print(f"\n Error di tab {tab.url}: {e}")
+                    close_tab(tab, "error")
+                    open_next_tab()
+                    continue
+
+                reason = None
+                if max_reviews and len(tab.data) >= max_reviews:
+                    reason = "target"
+                elif tab.filter.found_old_reviews_count >= max_old_reviews_before_stop:
+                    reason = f"batas {years_back} tahun"
+                elif tab.idle_seconds() >= max_idle_seconds:
+                    reason = "tidak ada data baru"
+
+                if reason:
+                    close_tab(tab, reason)
+                    open_next_tab()
+                    continue
+
+                # Picu scroll berikutnya tanpa menunggu; kartu dimuat selagi tab lain diproses
+                driver.execute_script(SCROLL_AND_FLAG_JS, tab.feed, CARD_SELECTORS)
+                tab.scrolls += 1
+
+                print(f" Tab {active.index(tab) + 1}/{len(active)} | Scroll #{tab.scrolls} | Data: {len(tab.data)} (+{added} baru) | Diskip: {tab.filter.skipped_count} | Lama: {tab.filter.found_old_reviews_count}/{max_old_reviews_before_stop}")
+
+            read_network_events(driver, usage)  # Per putaran, supaya log tidak menumpuk
+            if len(active) > 1:
+                # Jangan langsung berputar lagi: tunggu sampai ada tab yang menerima kartu baru
+                wait_for_any_tab(driver, active, timeout=new_cards_timeout)
+
+        return finished
+
+    except KeyboardInterrupt:
+        print("\n\n  Proses dihentikan oleh user (Ctrl+C)")
+        return finished
+
+    except Exception as e:
+        print(f"\n\n Error: {e}")
+        return finished
+
+    finally:
+        # Data tab yang belum selesai tetap di-flush ke file masing-masing
+        for tab in list(active):
+            tab.finish("dihentikan")
+            finished.append(tab)
+        active.clear()
+        SELECTOR_REGISTRY.report()
+        SELECTOR_REGISTRY.save_safely(SELECTOR_STATS_FILE)
         print("\nMenutup browser...")
         try:
             driver.quit()
@@ -508,6 +2473,15 @@ def scrape_reviews(url, chromedriver_path, max_reviews=None, headless=False, new
 
 def main():
     global TEMP_OUTPUT_FILE
+
+    parser = argparse.ArgumentParser(description="Scraping ulasan Google Maps")
+    parser.add_argument("--resume", action="store_true",
+                        help="Lanjutkan run yang terhenti dari checkpoint OUTPUT_FILE")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Hanya ambil ulasan baru sampai ketemu yang sudah ada di OUTPUT_FILE")
+    parser.add_argument("--user-data-dir", default="chrome_profile",
+                        help="Profil Chrome yang dipakai ulang (login cukup sekali)")
+    args = parser.parse_args()
     
     # ========== KONFIGURASI ==========
     GOOGLE_MAPS_URL = "https://maps.app.goo.gl/qGVx4jukWkAYDuX1A"
@@ -516,8 +2490,17 @@ def main():
     OUTPUT_FILE = "Museum10November.csv"
     HEADLESS = False
     NEWEST_FIRST = True
-    LOGIN_TIME = 30  # Waktu login saja
+    LOGIN_TIME = 30  # Waktu login (dilewati bila profil sudah login)
     YEARS_BACK = 5
+    BATCH_EXTRACT = True  # Ekstrak kartu ulasan via 1x execute_script
+    BLOCK_RESOURCES = False  # Jangan muat tile peta, foto, font, media
+    SERVER_PROFILE = False  # Headless ramping untuk VPS (tanpa login manual)
+    PRUNE_HARVESTED = False  # Kosongkan kartu yang sudah diambil (tempat besar)
+    NEW_CARDS_TIMEOUT = 2.0  # Batas tunggu kartu baru per scroll (detik)
+    ADAPTIVE_PACING = False  # Atur batch scroll & batas tunggu otomatis
+    CAPTURE_NETWORK = False  # Ambil ulasan dari respons jaringan (CDP), bukan DOM
+    HTTP_FETCHER = False  # Setelah token didapat, lanjut paginasi tanpa browser
+    STREAM_OUTPUT = True  # Tulis ke OUTPUT_FILE per batch (aman bila proses mati)
     # =================================
     
     TEMP_OUTPUT_FILE = OUTPUT_FILE
@@ -539,19 +2522,39 @@ def main():
             newest_first=NEWEST_FIRST,
             login_time=LOGIN_TIME,
             years_back=YEARS_BACK,
+            batch_extract=BATCH_EXTRACT,
+            prune_harvested=PRUNE_HARVESTED,
+            new_cards_timeout=NEW_CARDS_TIMEOUT,
+            adaptive_pacing=ADAPTIVE_PACING,
+            capture_network=CAPTURE_NETWORK,
+            http_fetcher=HTTP_FETCHER,
+            stream_file=OUTPUT_FILE if STREAM_OUTPUT else None,
+            checkpoint_file=f"{OUTPUT_FILE}.checkpoint.json" if STREAM_OUTPUT else None,
+            resume=args.resume,
+            user_data_dir=args.user_data_dir or None,
+            block_resources=BLOCK_RESOURCES,
+            server_profile=SERVER_PROFILE,
+            incremental=args.refresh,
         )
 
         if len(reviews) > 0:
-            df = pd.DataFrame(reviews)
-            df.to_csv(OUTPUT_FILE, index=False, encoding="utf-8-sig")
+            if STREAM_OUTPUT:
+                # File sudah ditulis bertahap, baca kolom rating saja untuk statistik
+                ratings = pd.read_csv(OUTPUT_FILE, usecols=["rating"], encoding="utf-8-sig")["rating"]
+                preview = pd.read_csv(OUTPUT_FILE, nrows=3, encoding="utf-8-sig")
+            else:
+                df = pd.DataFrame(reviews.records)
+                df.to_csv(OUTPUT_FILE, index=False, encoding="utf-8-sig")
+                ratings = df["rating"]
+                preview = df.head(3)
             print(f"\n✓ Tersimpan: {OUTPUT_FILE}")
-            print(f"✓ Total: {len(df)} ulasan")
+            print(f"✓ Total: {len(reviews)} ulasan")
             
             print("\nStatistik:")
-            print(f"- Dengan rating: {df['rating'].notna().sum()}")
-            print(f"- Tanpa rating: {df['rating'].isna().sum()}")
+            print(f"- Dengan rating: {ratings.notna().sum()}")
+            print(f"- Tanpa rating: {ratings.isna().sum()}")
             print(f"\nPreview:")
-            print(df.head(3).to_string())
+            print(preview.to_string())
         else:
             print("\n✗ Tidak ada data terkumpul")
     
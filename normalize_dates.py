@@ -0,0 +1,78 @@
+import os
+import glob
+import time
+import argparse
+import pandas as pd
+from datetime import datetime
+
+from main import resolve_relative_dates
+
+
+def normalize_file(path, out_path, anchor=None):
+    """Tambah kolom date_abs/date_min/date_max/window_days ke 1 CSV ulasan.
+
+    Tiap baris dijangkarkan ke `scraped_at`-nya sendiri (file hasil refresh
+    berisi beberapa waktu scrape). `anchor`/waktu modifikasi file hanya untuk
+    baris tanpa `scraped_at`. date_min/date_max yang sudah diisi scraper
+    (mis. timestamp persis dari RPC) dipertahankan.
+    """
+    df = pd.read_csv(path, encoding="utf-8-sig", dtype={"date": "string"})
+    if "date" not in df:
+        return None
+    if anchor is None:
+        # Tanpa waktu scrape yang tercatat, waktu modifikasi file jadi jangkar
+        anchor = datetime.fromtimestamp(os.path.getmtime(path))
+    anchors = pd.Series(pd.Timestamp(anchor), index=df.index)
+    if "scraped_at" in df:
+        anchors = pd.to_datetime(df["scraped_at"], errors="coerce").fillna(anchors)
+    resolved = resolve_relative_dates(df["date"], anchors)
+
+    if "date_min" in df and "date_max" in df:
+        known_min = pd.to_datetime(df["date_min"], errors="coerce")
+        known_max = pd.to_datetime(df["date_max"], errors="coerce")
+        keep = known_min.notna() & known_max.notna()
+        resolved.loc[keep, "date_min"] = known_min[keep]
+        resolved.loc[keep, "date_max"] = known_max[keep]
+        resolved.loc[keep, "date_abs"] = known_min[keep] + (known_max[keep] - known_min[keep]) / 2
+        resolved.loc[keep, "window_days"] = (known_max[keep] - known_min[keep]).dt.total_seconds() / 86400
+
+    df[resolved.columns] = resolved
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    df.to_csv(out_path, index=False, encoding="utf-8-sig")
+    return len(df), int(resolved["date_abs"].isna().sum())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ubah tanggal relatif Maps ('2 tahun lalu') ke tanggal absolut")
+    parser.add_argument("--src", default="Data_Destinasi")
+    parser.add_argument("--out", default="Data_Destinasi_normalized")
+    parser.add_argument("--anchor", help="Waktu scrape untuk baris tanpa scraped_at (YYYY-MM-DD[ HH:MM]); default waktu modifikasi tiap file")
+    args = parser.parse_args()
+
+    anchor = pd.Timestamp(args.anchor) if args.anchor else None
+    files = sorted(glob.glob(os.path.join(args.src, "**", "*.csv"), recursive=True))
+
+    started = time.time()
+    total_rows = 0
+    total_unparsed = 0
+    for path in files:
+        out_path = os.path.join(args.out, os.path.relpath(path, args.src))
+        try:
+            result = normalize_file(path, out_path, anchor)
+        except Exception as e:
+            print(f"  {path}: {e}")
+            continue
+        if result is None:
+            print(f"  {path}: tidak ada kolom date, dilewati")
+            continue
+        rows, unparsed = result
+        total_rows += rows
+        total_unparsed += unparsed
+
+    print(f"✓ {len(files)} file, {total_rows} ulasan dalam {time.time() - started:.1f} detik")
+    print(f"✓ Tidak dikenali: {total_unparsed}")
+    print(f"✓ Hasil: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
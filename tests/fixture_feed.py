@@ -0,0 +1,110 @@
+"""Feed ulasan palsu untuk uji fetcher HTTP tanpa jaringan/browser."""
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from main import UGC_REVIEW_PATHS
+
+
+def _place(obj, path, value):
+    """Kebalikan _dig: taruh nilai di array bersarang, buat list bila perlu."""
+    for i, key in enumerate(path):
+        while len(obj) <= key:
+            obj.append(None)
+        if i == len(path) - 1:
+            obj[key] = value
+        else:
+            if not isinstance(obj[key], list):
+                obj[key] = []
+            obj = obj[key]
+
+
+def build_ugc_payload(records, next_token=None, offset=0):
+    """Susun body listugcposts dari record.
+
+    `offset` = posisi record pertama di seluruh feed, supaya id cadangan
+    tetap unik antar halaman.
+    """
+    entries = []
+    for i, rec in enumerate(records, offset):
+        entry = []
+        ts = rec.get("timestamp")
+        if isinstance(ts, str) and ts:
+            ts = int(datetime.fromisoformat(ts).timestamp() * 1_000_000)
+        _place(entry, UGC_REVIEW_PATHS["id"], rec.get("review_id") or f"fixture-{i}")
+        _place(entry, UGC_REVIEW_PATHS["name"], rec.get("name", ""))
+        _place(entry, UGC_REVIEW_PATHS["date"], rec.get("date", ""))
+        _place(entry, UGC_REVIEW_PATHS["timestamp"], ts or 0)
+        _place(entry, UGC_REVIEW_PATHS["rating"], int(float(rec["rating"])) if rec.get("rating") else None)
+        _place(entry, UGC_REVIEW_PATHS["text"], rec.get("text", ""))
+        entries.append(entry)
+    return ")]}'\n" + json.dumps([None, next_token, entries], ensure_ascii=False)
+
+
+class FixtureFeedServer:
+    """Server HTTP lokal pengganti endpoint feed ulasan, untuk uji fetcher offline.
+
+    Contoh:
+        with FixtureFeedServer(records, page_size=10) as fx:
+            fetcher = ReviewFeedFetcher(fx.url_template)
+            data = []
+            fetch_reviews_http(fetcher, fx.first_token, data, ReviewFilter())
+    """
+
+    def __init__(self, records, page_size=10, host="127.0.0.1", port=0):
+        self.pages = {}
+        chunks = [records[i:i + page_size] for i in range(0, len(records), page_size)] or [[]]
+        for n, chunk in enumerate(chunks):
+            next_token = f"fx{n + 1}" if n + 1 < len(chunks) else None
+            self.pages[f"fx{n}"] = build_ugc_payload(chunk, next_token, offset=n * page_size).encode("utf-8")
+        self.first_token = "fx0"
+        self.requests = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                server.requests += 1
+                query = urlsplit(self.path).query
+                token = query.split("!2s", 1)[1].split("!", 1)[0] if "!2s" in query else ""
+                body = server.pages.get(token)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.thread = None
+
+    @property
+    def url_template(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/maps/rpc/listugcposts?pb=!1m1!2s{{token}}!3e1"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
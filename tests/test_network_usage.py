@@ -0,0 +1,37 @@
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("webdriver_manager")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import NetworkUsage, network_usage  # noqa: E402
+
+
+class FakeDriver:
+    def __init__(self, events):
+        self.events = events
+
+    def get_log(self, kind):
+        entries = [{"message": json.dumps({"message": {"method": m, "params": p}, "webview": w})}
+                   for w, m, p in self.events]
+        self.events = []
+        return entries
+
+
+def test_counts_received_bytes_and_blocked_requests_per_tab():
+    driver = FakeDriver([
+        ("AAA", "Network.loadingFinished", {"requestId": "1", "encodedDataLength": 1000}),
+        ("AAA", "Network.loadingFailed", {"requestId": "2", "blockedReason": "inspector"}),
+        ("AAA", "Network.loadingFailed", {"requestId": "3", "errorText": "net::ERR_ABORTED"}),
+        ("BBB", "Network.loadingFinished", {"requestId": "4", "encodedDataLength": 500}),
+    ])
+    usage = NetworkUsage()
+
+    assert network_usage(driver, usage) == (1500, 1)
+    assert usage.totals("AAA") == (1000, 1)
+    assert usage.totals("bbb") == (500, 0)
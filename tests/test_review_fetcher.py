@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("webdriver_manager")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import ReviewFeedFetcher, ReviewFilter, fetch_reviews_http, review_key  # noqa: E402
+from fixture_feed import FixtureFeedServer  # noqa: E402
+
+
+def make_records(n):
+    return [{"name": f"User {i}", "rating": 5, "date": "2 hari lalu", "text": f"Ulasan {i}"} for i in range(n)]
+
+
+def test_fetcher_reads_every_page():
+    records = make_records(25)
+    with FixtureFeedServer(records, page_size=10) as fx:
+        fetcher = ReviewFeedFetcher(fx.url_template)
+        data = []
+        try:
+            review_filter = fetch_reviews_http(fetcher, fx.first_token, data, ReviewFilter())
+        finally:
+            fetcher.close()
+
+    assert fetcher.requests == 3
+    assert len(data) == 25
+    assert len({r["review_id"] for r in data}) == 25
+    assert [r["name"] for r in data] == [r["name"] for r in records]
+    assert (review_filter.skipped_count, review_filter.skipped_old_date) == (0, 0)
+
+
+def test_fetcher_stops_at_max_reviews():
+    with FixtureFeedServer(make_records(25), page_size=10) as fx:
+        fetcher = ReviewFeedFetcher(fx.url_template)
+        data = []
+        try:
+            fetch_reviews_http(fetcher, fx.first_token, data, ReviewFilter(), max_reviews=15)
+        finally:
+            fetcher.close()
+
+    assert len(data) == 15
+    assert fetcher.requests == 2
+
+
+def test_fetcher_stops_at_known_reviews():
+    records = make_records(25)
+    known = {review_key(r["name"], r["text"]) for r in records[8:]}  # Sudah tersimpan dari run sebelumnya
+    with FixtureFeedServer(records, page_size=10) as fx:
+        fetcher = ReviewFeedFetcher(fx.url_template)
+        data = []
+        try:
+            fetch_reviews_http(fetcher, fx.first_token, data, ReviewFilter(known=known, known_run_to_stop=5))
+        finally:
+            fetcher.close()
+
+    assert [r["name"] for r in data] == [r["name"] for r in records[:8]]
+    assert fetcher.requests == 2
@@ -0,0 +1,52 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("selenium")
+pytest.importorskip("webdriver_manager")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import ReviewFilter, review_key  # noqa: E402
+
+
+def card(i, date="2 hari lalu", text=None, **extra):
+    return {
+        "signature": f"sig-{i}", "id": f"id-{i}", "name": f"User {i}", "date": date,
+        "text": f"Ulasan {i}" if text is None else text, "rating_aria": "5 bintang", "extra": extra,
+    }
+
+
+def test_check_reasons_and_counters():
+    f = ReviewFilter(years_back=5)
+    now = datetime(2026, 1, 1)
+
+    record, reason = f.check(card(1, timestamp="2025-12-30T10:00:00"), now)
+    assert reason is None
+    assert record["review_id"] == "id-1"
+    assert record["date_min"] == record["date_max"] == "2025-12-30T10:00:00"
+
+    assert f.check(card(1), now) == (None, "seen")
+    assert f.check(None, now) == (None, "seen")
+    assert f.check(card(2, text=""), now) == (None, "incomplete")
+    assert f.check(card(3, date="10 tahun lalu"), now) == (None, "old")
+    assert (f.skipped_count, f.skipped_old_date, f.found_old_reviews_count) == (1, 1, 1)
+    assert f.last_review_id == "id-3"
+
+    f.check(card(4), now)
+    assert f.found_old_reviews_count == 0
+
+
+def test_known_streak_resets_on_new_review():
+    known = {"id-1", review_key("User 2", "Ulasan 2"), "id-4"}
+    f = ReviewFilter(known=known, known_run_to_stop=2)
+    now = datetime(2026, 1, 1)
+
+    assert f.check(card(1), now) == (None, "known")
+    assert f.check(card(3), now)[1] is None
+    assert not f.reached_known()
+    assert f.check(card(4), now) == (None, "known")
+    assert f.check(card(2), now) == (None, "known")
+    assert f.reached_known()